@@ -181,8 +181,7 @@ class BaseAgent(ABC):
 
         tools_param = []
         for toolkit in self.tools:
-            for func in toolkit.functions.values():
-                tools_param.append({"type": "function", "function": func.to_dict()})
+            tools_param.extend(toolkit.tool_schemas())
 
         return tools_param
 
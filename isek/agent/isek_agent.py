@@ -94,12 +94,12 @@ class IsekAgent(BaseAgent):
             self._store_conversation(user_id, session_id, message, response_content)
 
         if self.debug_mode:
-            log.debug(f"Session ID: {session_id}")
-            log.debug(f"User ID: {user_id}")
-            log.debug(f"User message: {message}")
-            log.debug(f"Model response: {response_content}")
+            log.debug("Session ID: %s", session_id)
+            log.debug("User ID: %s", user_id)
+            log.debug("User message: %s", message)
+            log.debug("Model response: %s", response_content)
             if tools_param:
-                log.debug(f"Tools: {tools_param}")
+                log.debug("Tools: %s", tools_param)
 
         return response_content
 
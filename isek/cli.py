@@ -1,11 +1,18 @@
 #!/usr/bin/env python
+# Only what shell completion needs is imported at module level; setup-only
+# and loader-only modules are imported inside the commands that use them.
 import click
-import importlib.util
-import subprocess
+import functools
 import sys
-import shutil
-import platform
 from pathlib import Path
+from types import ModuleType
+from typing import Dict, Tuple
+
+EXAMPLES_DIR = Path(__file__).parent.parent / "examples"
+
+# Scripts loaded by load_module: path -> (mtime_ns, module). Holding one
+# entry per path means an edited script replaces, not accumulates, its entry.
+_MODULE_CACHE: Dict[str, Tuple[int, ModuleType]] = {}
 
 
 def get_npm_command():
@@ -13,6 +20,9 @@ def get_npm_command():
     Returns the available npm executable path on the current platform
     (supports Windows, Linux, and macOS).
     """
+    import platform
+    import shutil
+
     if platform.system() == "Windows":
         return shutil.which("npm.cmd") or shutil.which("npm")
     else:
@@ -21,29 +31,57 @@ def get_npm_command():
 
 def load_module(script_path: Path):
     """Dynamically load module"""
+    import importlib.util
+
     try:
-        module_name = script_path.stem
+        # Namespaced so a script called e.g. "agent" cannot shadow a real module
+        module_name = f"isek_examples.{script_path.stem}"
+        # Compared on mtime so an edited script is re-executed on the next call
+        path_key = str(script_path)
+        mtime = script_path.stat().st_mtime_ns
+        cached = _MODULE_CACHE.get(path_key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
         spec = importlib.util.spec_from_file_location(module_name, script_path)
         if spec is None or spec.loader is None:
             raise ImportError(f"Could not load module from {script_path}")
         module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            sys.modules.pop(module_name, None)
+            raise
+        _MODULE_CACHE[path_key] = (mtime, module)
         return module
     except Exception as e:
         click.secho(f"Module load error: {e}", fg="red")
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=1)
+def _list_examples(examples_dir: str, mtime: int) -> tuple:
+    """List example script names; ``mtime`` keys the cache so new files show up"""
+    return tuple(
+        f.stem
+        for f in Path(examples_dir).glob("*.py")
+        if f.name != "__init__.py" and not f.name.startswith("_")
+    )
+
+
+def get_example_names() -> tuple:
+    """Get the cached example script names"""
+    # One stat per completion; the directory is only re-globbed when it changes
+    try:
+        mtime = EXAMPLES_DIR.stat().st_mtime_ns
+    except OSError:
+        return ()
+    return _list_examples(str(EXAMPLES_DIR), mtime)
+
+
 def get_available_examples(ctx, args, incomplete):
     """Get available example scripts"""
-    examples_dir = Path(__file__).parent.parent / "examples"
-    return [
-        f.stem
-        for f in examples_dir.glob("*.py")
-        if f.name != "__init__.py"
-        and not f.name.startswith("_")
-        and f.stem.startswith(incomplete)
-    ]
+    return [name for name in get_example_names() if name.startswith(incomplete)]
 
 
 @click.group()
@@ -71,6 +109,9 @@ def registry():
 @cli.command()
 def setup():
     """Install ISEK Python and JavaScript dependencies"""
+    import subprocess
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
     project_root = Path(__file__).parent.parent
     # Use importlib.resources to find P2P directory in both dev and PyPI environments
     import importlib.resources
@@ -84,29 +125,29 @@ def setup():
 
     click.secho("🚀 Setting up ISEK dependencies...", fg="blue")
 
-    # Step 1: Install Python dependencies (only in development)
     def is_development_environment():
         # Check if we're in a development environment by looking for pyproject.toml
         # relative to the ISEK package directory, not the current working directory
         isek_package_dir = Path(__file__).parent.parent
         return (isek_package_dir / "pyproject.toml").exists()
 
+    # pip and npm installs are independent, so they run concurrently below.
+    # Each task is (label, command, cwd).
+    tasks = []
+
+    # Step 1: Install Python dependencies (only in development)
     if is_development_environment():
         click.secho(
             "📦 Installing Python dependencies (development mode)...", fg="yellow"
         )
-        try:
-            # Use the project root directory, not the current working directory
-            project_root = Path(__file__).parent.parent
-            subprocess.check_call(
+        # Use the project root directory, not the current working directory
+        tasks.append(
+            (
+                "pip",
                 [sys.executable, "-m", "pip", "install", "-e", str(project_root)],
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
+                project_root,
             )
-            click.secho("✓ Python dependencies installed (editable mode)", fg="green")
-        except subprocess.CalledProcessError as e:
-            click.secho(f"✗ Python dependency installation failed: {e}", fg="red")
-            sys.exit(e.returncode)
+        )
     else:
         click.secho("📦 Skipping Python dependency install (PyPI mode)", fg="yellow")
         click.secho(
@@ -114,34 +155,66 @@ def setup():
             fg="yellow",
         )
 
-    # Step 2: Check if Node.js is installed
+    # Step 2: Check if Node.js is installed (npm install depends on it)
+    node_available = True
     try:
         subprocess.run(["node", "--version"], check=True, capture_output=True)
         subprocess.run(
             [get_npm_command(), "--version"], check=True, capture_output=True
         )
     except (subprocess.CalledProcessError, FileNotFoundError):
+        node_available = False
         click.secho(
             "⚠️  Node.js and npm are required for P2P functionality", fg="yellow"
         )
         click.secho("   Please install Node.js from https://nodejs.org/", fg="yellow")
         click.secho("   Then run 'isek setup' again", fg="yellow")
-        return
 
     # Step 3: Install JavaScript dependencies
-    if p2p_dir.exists() and (p2p_dir / "package.json").exists():
+    if node_available and p2p_dir.exists() and (p2p_dir / "package.json").exists():
         click.secho("📦 Installing JavaScript dependencies for P2P...", fg="yellow")
-        try:
-            subprocess.check_call(
-                [get_npm_command(), "install"],
-                cwd=p2p_dir,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            click.secho("✓ JavaScript dependencies installed", fg="green")
-        except subprocess.CalledProcessError as e:
-            click.secho(f"✗ JavaScript dependency installation failed: {e}", fg="red")
-            click.secho("   P2P functionality may not work correctly", fg="yellow")
+        tasks.append(("npm", [get_npm_command(), "install"], p2p_dir))
+
+    pip_error = None
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            executor.submit(
+                subprocess.run, cmd, cwd=cwd, check=True, capture_output=True
+            ): label
+            for label, cmd, cwd in tasks
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                future.result()
+            except subprocess.CalledProcessError as e:
+                stderr = (e.stderr or b"").decode(errors="replace").strip()
+                detail = stderr.splitlines()[-1] if stderr else e
+                if label == "pip":
+                    click.secho(
+                        f"✗ Python dependency installation failed: {detail}", fg="red"
+                    )
+                    pip_error = e
+                else:
+                    click.secho(
+                        f"✗ JavaScript dependency installation failed: {detail}",
+                        fg="red",
+                    )
+                    click.secho(
+                        "   P2P functionality may not work correctly", fg="yellow"
+                    )
+                continue
+            if label == "pip":
+                click.secho(
+                    "✓ Python dependencies installed (editable mode)", fg="green"
+                )
+            else:
+                click.secho("✓ JavaScript dependencies installed", fg="green")
+
+    if pip_error is not None:
+        sys.exit(pip_error.returncode)
+    if not node_available:
+        return
 
     click.secho("🎉 ISEK setup completed successfully!", fg="green")
     click.secho("   You can now run examples with 'isek example run <name>'", fg="blue")
@@ -155,15 +228,8 @@ def example():
 @example.command()
 def list():
     """List available example scripts"""
-    examples_dir = Path(__file__).parent.parent / "examples"
-    examples = [
-        f.stem
-        for f in examples_dir.glob("*.py")
-        if f.name != "__init__.py" and not f.name.startswith("_")
-    ]
-
     click.echo("Available examples:")
-    for name in sorted(examples):
+    for name in sorted(get_example_names()):
         click.echo(f"  • {name}")
 
 
@@ -174,7 +240,7 @@ def list():
 @click.pass_context
 def run(ctx, name: str):
     """Execute specific example script"""
-    script_path = Path(__file__).parent.parent / "examples" / f"{name}.py"
+    script_path = EXAMPLES_DIR / f"{name}.py"
 
     module = load_module(script_path)
     if hasattr(module, "main"):
@@ -186,5 +252,79 @@ def run(ctx, name: str):
         sys.exit(1)
 
 
+def _static_completion_script(shell: str) -> str:
+    """Render a completion script with commands and examples baked in"""
+    top_level = sorted(cli.commands)
+    subcommands = {
+        name: sorted(command.commands)
+        for name, command in cli.commands.items()
+        if isinstance(command, click.Group)
+    }
+    examples = sorted(get_example_names())
+    shells = ["bash", "fish", "zsh"]
+
+    if shell == "fish":
+        lines = [
+            "complete -c isek -f",
+            "complete -c isek -n '__fish_use_subcommand' -a '{}'".format(
+                " ".join(top_level)
+            ),
+        ]
+        for group, names in subcommands.items():
+            joined = " ".join(names)
+            lines.append(
+                f"complete -c isek -n '__fish_seen_subcommand_from {group}; "
+                f"and not __fish_seen_subcommand_from {joined}' -a '{joined}'"
+            )
+        lines.append(
+            "complete -c isek -n '__fish_seen_subcommand_from run' -a '{}'".format(
+                " ".join(examples)
+            )
+        )
+        lines.append(
+            "complete -c isek -n '__fish_seen_subcommand_from completion' -a '{}'".format(
+                " ".join(shells)
+            )
+        )
+        return "\n".join(lines) + "\n"
+
+    group_cases = "\n".join(
+        f'            {group}) words="{" ".join(names)}" ;;'
+        for group, names in subcommands.items()
+    )
+    script = f"""_isek_completion() {{
+    local cur words=""
+    cur="${{COMP_WORDS[COMP_CWORD]}}"
+    if [[ $COMP_CWORD -eq 1 ]]; then
+        words="{" ".join(top_level)}"
+    elif [[ $COMP_CWORD -eq 2 ]]; then
+        case "${{COMP_WORDS[1]}}" in
+{group_cases}
+            completion) words="{" ".join(shells)}" ;;
+        esac
+    elif [[ $COMP_CWORD -eq 3 && "${{COMP_WORDS[1]}} ${{COMP_WORDS[2]}}" == "example run" ]]; then
+        words="{" ".join(examples)}"
+    fi
+    COMPREPLY=($(compgen -W "$words" -- "$cur"))
+}}
+complete -F _isek_completion isek
+"""
+    if shell == "zsh":
+        script = "autoload -U +X bashcompinit && bashcompinit\n" + script
+    return script
+
+
+@cli.command()
+@click.argument("shell", type=click.Choice(["bash", "zsh", "fish"]))
+def completion(shell: str):
+    """Print a static shell completion script
+
+    Unlike click's dynamic completion this does not start Python on every
+    TAB press. Enable it with e.g. eval "$(isek completion bash)" and re-run
+    after adding examples.
+    """
+    click.echo(_static_completion_script(shell), nl=False)
+
+
 if __name__ == "__main__":
     cli()
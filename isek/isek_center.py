@@ -1,87 +1,235 @@
-from isek.utils.log import team_log
-import uvicorn
+# isek.utils.log has a single package logger; the center logs through it
+from isek.utils.log import log as team_log
+import heapq
+from waitress import serve
 import threading
 import time
-from typing import Dict, Any, Optional, Tuple
+import uuid
+from collections import deque
+from typing import Deque, Dict, Any, List, Optional, Tuple
 
-from flask import Flask, request, jsonify, Blueprint
+import orjson
+from flask import Flask, Blueprint, Response, current_app, request
+from flask_compress import Compress
+from flask.json.provider import JSONProvider
 
 # --- Global State & Configuration ---
 isek_center_blueprint = Blueprint(
     "isek_center_blueprint", __name__, url_prefix="/isek_center"
 )
 
-# In-memory storage for registered nodes.
-# Structure: { "node_id": {"node_id": str, "host": str, "port": int, "metadata": dict, "expires_at": float} }
+# In-memory storage for registered nodes, kept as two parallel maps so lease
+# bookkeeping only touches floats and the node records are never rewritten.
+# nodes:        { "node_id": {"node_id": str, "host": str, "port": int, "metadata": dict} }
+# lease_expiry: { "node_id": expires_at }
+# expires_at is on the time.monotonic() clock, so wall-clock jumps never expire leases.
 nodes: Dict[str, Dict[str, Any]] = {}
+lease_expiry: Dict[str, float] = {}
+# Min-heap of (expires_at, node_id), pushed on every register/renew. Entries
+# whose expires_at no longer matches lease_expiry are stale and skipped.
+expiry_heap: List[Tuple[float, str]] = []
+# Wakes the cleanup thread when a lease is scheduled ahead of its current deadline.
+cleanup_wakeup = threading.Event()
+_cleanup_thread: Optional[threading.Thread] = None
+# Writers hold NODE_LOCK; readers take an unlocked lease_expiry.copy() snapshot.
 NODE_LOCK = threading.Lock()
+# Bumped (under NODE_LOCK) whenever the node set changes; renewals leave it alone.
+registry_version: int = 0
+# Clients see versions as "<epoch>-<version>" tags; the per-process epoch makes
+# tags from a previous center run fall back to a full listing.
+REGISTRY_EPOCH: str = uuid.uuid4().hex[:8]
+# Recent node-set changes as (version, node_id, record or None for removal),
+# used to answer /available_nodes?since=<tag> with a delta.
+CHANGE_LOG_SIZE: int = 1024
+change_log: Deque[Tuple[int, str, Optional[Dict[str, Any]]]] = deque(
+    maxlen=CHANGE_LOG_SIZE
+)
+
+# Cached /available_nodes body as (registry_version, valid_until, body). It is
+# reused while the version is unchanged and for at most SNAPSHOT_TTL seconds,
+# which also bounds how long a lapsed-but-not-yet-evicted lease stays listed.
+SNAPSHOT_TTL: float = 1.0
+_snapshot_cache: Tuple[int, float, bytes] = (-1, 0.0, b"")
 
 LEASE_DURATION: int = 30
 
 # --- Type Alias ---
-FlaskResponse = Tuple[Dict[str, Any], int]
+FlaskResponse = Tuple[Response, int]
 
 
 # --- Response Helper Class ---
+# Constant response shells; helpers shallow-copy these instead of building
+# a throwaway CommonResponse instance per request.
+_SUCCESS_TEMPLATE: Dict[str, Any] = {"code": 200, "message": "success", "data": None}
+_FAIL_TEMPLATE: Dict[str, Any] = {"code": 400, "message": "", "data": None}
+# Pre-serialized body for the common data-less 200; only the message varies.
+_OK_TEMPLATE = b'{"code":200,"message":%s,"data":null}'
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+
 class CommonResponse:
     """A helper class to standardize JSON API responses."""
 
-    def __init__(self, data: Optional[Any], code: int, message: str):
-        self.data: Optional[Any] = data
-        self.code: int = code
-        self.message: str = message
-
     @classmethod
     def success(
         cls, data: Optional[Any] = None, code: int = 200, message: str = "success"
     ) -> FlaskResponse:
-        return jsonify(cls(data, code, message).to_dict()), code
+        if data is None and code == 200:
+            return current_app.response_class(
+                _OK_TEMPLATE % orjson.dumps(message), mimetype="application/json"
+            ), code
+        return cls._respond(
+            {**_SUCCESS_TEMPLATE, "code": code, "message": message, "data": data}
+        ), code
 
     @classmethod
     def fail(
         cls, message: str, code: int = 400, data: Optional[Any] = None
     ) -> FlaskResponse:
-        return jsonify(cls(data, code, message).to_dict()), code
+        return cls._respond(
+            {**_FAIL_TEMPLATE, "code": code, "message": message, "data": data}
+        ), code
+
+    @staticmethod
+    def _respond(payload: Dict[str, Any]) -> Response:
+        # Serialize with orjson directly instead of going through jsonify
+        return current_app.response_class(
+            orjson.dumps(payload), mimetype="application/json"
+        )
 
-    def to_dict(self) -> Dict[str, Any]:
-        return {"code": self.code, "message": self.message, "data": self.data}
 
+# --- Registry Helpers ---
+def _parse_node_record(data: Any) -> Dict[str, Any]:
+    """Validates a registration payload and builds the stored node record.
 
-# --- Flask Route Definitions ---
-@isek_center_blueprint.route("/register", methods=["POST"])
-def register_node_route() -> FlaskResponse:
-    data = request.json
-    if not data:
-        return CommonResponse.fail(message="Request body must be JSON.", code=400)
+    :raises ValueError: If a required field is missing or malformed.
+    """
+    if not isinstance(data, dict):
+        raise ValueError("Each node must be a JSON object.")
 
     node_id = data.get("node_id")
     host = data.get("host")
     port = data.get("port")
-    metadata = data.get("metadata")
 
     if not all([node_id, host, port]):
-        return CommonResponse.fail(
-            message="'node_id', 'host', and 'port' are required fields.", code=400
-        )
+        raise ValueError("'node_id', 'host', and 'port' are required fields.")
+
+    if not isinstance(node_id, str):
+        raise ValueError("'node_id' must be a string.")
 
     if not isinstance(port, int):
-        return CommonResponse.fail(message="'port' must be an integer.", code=400)
+        raise ValueError("'port' must be an integer.")
+
+    return {
+        "node_id": node_id,
+        "host": host,
+        "port": port,
+        "metadata": data.get("metadata") or {},
+    }
+
+
+def _schedule_expiry(expires_at: float, node_id: str) -> None:
+    """Queues a lease deadline. Must be called with ``NODE_LOCK`` held."""
+    if not expiry_heap or expires_at < expiry_heap[0][0]:
+        cleanup_wakeup.set()
+    heapq.heappush(expiry_heap, (expires_at, node_id))
+
+
+def _record_change(node_id: str, record: Optional[Dict[str, Any]]) -> None:
+    """Logs a node-set change and bumps ``registry_version``.
+
+    ``record`` is ``None`` for removals. The entry is appended before the
+    version is bumped, so a lock-free reader that sees version ``v`` always
+    finds every change up to ``v`` in ``change_log``.
+    Must be called with ``NODE_LOCK`` held.
+    """
+    global registry_version
+    change_log.append((registry_version + 1, node_id, record))
+    registry_version += 1
+
+
+def _version_tag(version: int) -> str:
+    return f"{REGISTRY_EPOCH}-{version}"
+
+
+def _changes_since(tag: str) -> Optional[Dict[str, Any]]:
+    """Collapses the changes after version ``tag`` into an added/removed delta.
+
+    Returns ``None`` when the tag is unknown, from another center run, or older
+    than the retained change log, in which case the caller must send a full
+    listing.
+    """
+    epoch, _, raw_version = tag.partition("-")
+    if epoch != REGISTRY_EPOCH or not raw_version.isdigit():
+        return None
+    since = int(raw_version)
+    version = registry_version
+    events = list(change_log)
+    if since > version:
+        return None
+    if since < version and (not events or events[0][0] > since + 1):
+        return None
+
+    added: Dict[str, Dict[str, Any]] = {}
+    removed = set()
+    for event_version, node_id, record in events:
+        if event_version <= since:
+            continue
+        if record is None:
+            added.pop(node_id, None)
+            removed.add(node_id)
+        else:
+            added[node_id] = record
+            removed.discard(node_id)
+    latest = max(version, events[-1][0]) if events else version
+    return {
+        "version": _version_tag(latest),
+        "added": added,
+        "removed": sorted(removed),
+    }
+
+
+def _store_node(record: Dict[str, Any], expires_at: float) -> None:
+    """Inserts or replaces a node record. Must be called with ``NODE_LOCK`` held."""
+    node_id = record["node_id"]
+    nodes[node_id] = record
+    lease_expiry[node_id] = expires_at
+    _schedule_expiry(expires_at, node_id)
+    _record_change(node_id, record)
+
+
+# --- Flask Route Definitions ---
+@isek_center_blueprint.route("/register", methods=["POST"])
+def register_node_route() -> FlaskResponse:
+    data = request.get_json(silent=True, cache=False)
+    if not data:
+        return CommonResponse.fail(message="Request body must be JSON.", code=400)
+
+    try:
+        record = _parse_node_record(data)
+    except ValueError as e:
+        return CommonResponse.fail(message=str(e), code=400)
+    node_id = record["node_id"]
 
+    expires_at = time.monotonic() + LEASE_DURATION
     with NODE_LOCK:
-        nodes[node_id] = {
-            "node_id": node_id,
-            "host": host,
-            "port": port,
-            "metadata": metadata or {},
-            "expires_at": time.time() + LEASE_DURATION,
-        }
+        _store_node(record, expires_at)
     team_log.info(f"Node registered/updated: {node_id}")
     return CommonResponse.success(message=f"Node '{node_id}' registered successfully.")
 
 
 @isek_center_blueprint.route("/deregister", methods=["POST"])
 def deregister_node_route() -> FlaskResponse:
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return CommonResponse.fail(message="Request body must be JSON.", code=400)
 
@@ -91,11 +239,14 @@ def deregister_node_route() -> FlaskResponse:
         return CommonResponse.fail(message="'node_id' is required.", code=400)
 
     with NODE_LOCK:
-        if node_id not in nodes:
-            return CommonResponse.fail(
-                message=f"Node '{node_id}' not found for deregistration.", code=404
-            )
-        removed_node = nodes.pop(node_id)
+        lease_expiry.pop(node_id, None)
+        removed_node = nodes.pop(node_id, None)
+        if removed_node is not None:
+            _record_change(node_id, None)
+    if removed_node is None:
+        return CommonResponse.fail(
+            message=f"Node '{node_id}' not found for deregistration.", code=404
+        )
     team_log.debug(f"Node deregistered: {node_id}, Details: {removed_node}")
     return CommonResponse.success(
         message=f"Node '{node_id}' deregistered successfully."
@@ -104,20 +255,51 @@ def deregister_node_route() -> FlaskResponse:
 
 @isek_center_blueprint.route("/available_nodes", methods=["GET"])
 def get_available_nodes_route() -> FlaskResponse:
-    current_time = time.time()
-    with NODE_LOCK:
-        active_nodes = {
-            k: v for k, v in nodes.items() if v.get("expires_at", 0) > current_time
-        }
-
-    response_payload = {"available_nodes": active_nodes}
+    """Lists the live nodes, or only what changed when ``?since=<version>`` is given.
+
+    A full listing is ``{"available_nodes": {...}, "version": tag}``. With a
+    ``since`` tag from an earlier response the data is instead
+    ``{"version": tag, "added": {...}, "removed": [...]}``; if the tag cannot
+    be served as a delta, the full listing is returned.
+    """
+    global _snapshot_cache
+    since = request.args.get("since")
+    if since:
+        delta = _changes_since(since)
+        if delta is not None:
+            return CommonResponse.success(data=delta)
+
+    current_time = time.monotonic()
+    cached_version, valid_until, body = _snapshot_cache
+    # Read the version before copying so a concurrent write leaves the cache stale
+    version = registry_version
+    if cached_version == version and current_time < valid_until:
+        return current_app.response_class(body, mimetype="application/json"), 200
+
+    # Lock-free read: dict.copy() is atomic under the GIL and node records are
+    # never mutated, so readers never block writers. Leases that lapsed since
+    # the last cleanup tick are filtered out here; a node deregistered after
+    # the snapshot was taken is skipped by the None check.
+    active_nodes = {}
+    for node_id, expires_at in lease_expiry.copy().items():
+        if expires_at > current_time:
+            node = nodes.get(node_id)
+            if node is not None:
+                active_nodes[node_id] = node
+
+    response_payload = {
+        "available_nodes": active_nodes,
+        "version": _version_tag(version),
+    }
+    body = orjson.dumps({**_SUCCESS_TEMPLATE, "data": response_payload})
+    _snapshot_cache = (version, current_time + SNAPSHOT_TTL, body)
     team_log.debug(f"Returning {len(active_nodes)} available nodes.")
-    return CommonResponse.success(data=response_payload)
+    return current_app.response_class(body, mimetype="application/json"), 200
 
 
 @isek_center_blueprint.route("/renew", methods=["POST"])
 def renew_lease_route() -> FlaskResponse:
-    data = request.json
+    data = request.get_json(silent=True, cache=False)
     if not data:
         return CommonResponse.fail(message="Request body must be JSON.", code=400)
 
@@ -126,49 +308,165 @@ def renew_lease_route() -> FlaskResponse:
     if not node_id:
         return CommonResponse.fail(message="'node_id' is required.", code=400)
 
+    expires_at = time.monotonic() + LEASE_DURATION
     with NODE_LOCK:
-        if node_id in nodes:
-            nodes[node_id]["expires_at"] = time.time() + LEASE_DURATION
-            team_log.debug(f"Lease renewed for node: {node_id}")
-            return CommonResponse.success(
-                message=f"Lease for node '{node_id}' renewed successfully."
-            )
-        else:
+        found = node_id in lease_expiry
+        if found:
+            lease_expiry[node_id] = expires_at
+            _schedule_expiry(expires_at, node_id)
+    if not found:
+        return CommonResponse.fail(
+            message=f"Node '{node_id}' not found for lease renewal.", code=404
+        )
+    team_log.debug(f"Lease renewed for node: {node_id}")
+    return CommonResponse.success(
+        message=f"Lease for node '{node_id}' renewed successfully."
+    )
+
+
+@isek_center_blueprint.route("/register_batch", methods=["POST"])
+def register_batch_route() -> FlaskResponse:
+    """Registers many nodes with a single request and lock acquisition."""
+    data = request.get_json(silent=True, cache=False)
+    if not isinstance(data, dict):
+        return CommonResponse.fail(
+            message="Request body must be a JSON object.", code=400
+        )
+
+    batch = data.get("nodes")
+    if not isinstance(batch, list) or not batch:
+        return CommonResponse.fail(
+            message="'nodes' must be a non-empty list.", code=400
+        )
+
+    # Validate the whole batch up front so it is applied all-or-nothing
+    records = []
+    for index, item in enumerate(batch):
+        try:
+            records.append(_parse_node_record(item))
+        except ValueError as e:
+            return CommonResponse.fail(message=f"nodes[{index}]: {e}", code=400)
+
+    expires_at = time.monotonic() + LEASE_DURATION
+    with NODE_LOCK:
+        for record in records:
+            _store_node(record, expires_at)
+    team_log.info(f"Batch registered/updated {len(records)} nodes.")
+    return CommonResponse.success(
+        message=f"{len(records)} nodes registered successfully."
+    )
+
+
+@isek_center_blueprint.route("/renew_batch", methods=["POST"])
+def renew_batch_route() -> FlaskResponse:
+    """Renews the leases of many nodes with a single lock acquisition.
+
+    Unknown node IDs do not fail the request; they are reported back under
+    ``not_found`` so the caller can re-register them.
+    """
+    data = request.get_json(silent=True, cache=False)
+    if not isinstance(data, dict):
+        return CommonResponse.fail(
+            message="Request body must be a JSON object.", code=400
+        )
+
+    node_ids = data.get("node_ids")
+    if not isinstance(node_ids, list) or not node_ids:
+        return CommonResponse.fail(
+            message="'node_ids' must be a non-empty list.", code=400
+        )
+    # Validate before taking the lock so a bad entry cannot leave a partial renewal
+    for index, node_id in enumerate(node_ids):
+        if not isinstance(node_id, str):
             return CommonResponse.fail(
-                message=f"Node '{node_id}' not found for lease renewal.", code=404
+                message=f"node_ids[{index}] must be a string.", code=400
             )
 
+    renewed = []
+    not_found = []
+    expires_at = time.monotonic() + LEASE_DURATION
+    with NODE_LOCK:
+        for node_id in node_ids:
+            if node_id in lease_expiry:
+                lease_expiry[node_id] = expires_at
+                _schedule_expiry(expires_at, node_id)
+                renewed.append(node_id)
+            else:
+                not_found.append(node_id)
+    team_log.debug(f"Batch renewed {len(renewed)} leases, {len(not_found)} unknown.")
+    return CommonResponse.success(data={"renewed": renewed, "not_found": not_found})
+
 
 # --- Background Task ---
+def evict_expired_nodes(current_time: float) -> None:
+    """Removes nodes whose lease ended at or before ``current_time``.
+
+    Only heap entries that are due are examined, so the cost is proportional
+    to the number of expired (or superseded) leases rather than all nodes.
+    Must be called with ``NODE_LOCK`` held.
+    """
+    while expiry_heap and expiry_heap[0][0] <= current_time:
+        expires_at, node_id = heapq.heappop(expiry_heap)
+        # A renew/re-register pushed a newer entry; this one is stale
+        if lease_expiry.get(node_id) != expires_at:
+            continue
+        team_log.info(f"Node lease expired, removing: {node_id}")
+        del lease_expiry[node_id]
+        nodes.pop(node_id, None)
+        _record_change(node_id, None)
+
+
 def cleanup_expired_nodes():
-    """Periodically removes expired nodes from the registry."""
+    """Removes expired nodes from the registry as their leases run out.
+
+    Sleeps until the earliest pending deadline, or indefinitely while no
+    leases exist; ``cleanup_wakeup`` cuts the wait short when an earlier
+    deadline is scheduled.
+    """
     while True:
-        time.sleep(LEASE_DURATION / 2)
-        current_time = time.time()
+        # Clear before reading the heap so a concurrent schedule is not missed
+        cleanup_wakeup.clear()
         with NODE_LOCK:
-            expired_node_ids = [
-                node_id
-                for node_id, data in nodes.items()
-                if data.get("expires_at", 0) < current_time
-            ]
-            for node_id in expired_node_ids:
-                team_log.info(f"Node lease expired, removing: {node_id}")
-                del nodes[node_id]
+            evict_expired_nodes(time.monotonic())
+            next_deadline = expiry_heap[0][0] if expiry_heap else None
+        timeout = (
+            None
+            if next_deadline is None
+            else max(0.0, next_deadline - time.monotonic())
+        )
+        cleanup_wakeup.wait(timeout)
 
 
 # --- Main Application Factory and Entry Point ---
-def main():
-    """Main function to run the Isek Center."""
+def create_app() -> Flask:
+    """Builds the Isek Center app and starts the lease cleanup thread.
+
+    Usable as a WSGI factory, e.g.
+    ``gunicorn -w 1 -k gthread --threads 16 "isek.isek_center:create_app()"``.
+    Node state lives in this process, so run a single worker.
+    """
+    global _cleanup_thread
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # Gzip large /available_nodes listings; small acks stay uncompressed
+    app.config["COMPRESS_MIN_SIZE"] = 500
+    Compress(app)
     app.register_blueprint(isek_center_blueprint)
 
     # Start the background task for cleaning up expired nodes
-    cleanup_thread = threading.Thread(target=cleanup_expired_nodes, daemon=True)
-    cleanup_thread.start()
+    if _cleanup_thread is None:
+        _cleanup_thread = threading.Thread(target=cleanup_expired_nodes, daemon=True)
+        _cleanup_thread.start()
+    return app
+
 
+def main():
+    """Main function to run the Isek Center."""
+    app = create_app()
     team_log.info("Starting Isek Center...")
-    # Use uvicorn to run the Flask app for better performance
-    uvicorn.run(app, host="0.0.0.0", port=8088, log_level="info")
+    # Flask is WSGI, so serve it from a threaded WSGI server rather than
+    # through an ASGI adapter.
+    serve(app, host="0.0.0.0", port=8088, threads=16)
 
 
 if __name__ == "__main__":
@@ -1,44 +1,59 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional
 from uuid import uuid4
 
-from pydantic import BaseModel
+import orjson
 
 
-class UserMemory(BaseModel):
+# Memories are written on every agent turn, so these are plain slotted
+# dataclasses rather than validated models.
+@dataclass(slots=True)
+class UserMemory:
     """Simple user memory model."""
 
-    memory_id: Optional[str] = None
     memory: str
     topics: Optional[List[str]] = None
-    last_updated: Optional[datetime] = None
-
-    def __post_init__(self):
-        if self.memory_id is None:
-            self.memory_id = str(uuid4())
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
+    memory_id: Optional[str] = field(default_factory=lambda: str(uuid4()))
+    last_updated: Optional[datetime] = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
-        return self.model_dump(exclude_none=True)
-
-
-class SessionSummary(BaseModel):
+        d: Dict[str, Any] = {"memory": self.memory}
+        if self.memory_id is not None:
+            d["memory_id"] = self.memory_id
+        if self.topics is not None:
+            d["topics"] = self.topics
+        if self.last_updated is not None:
+            d["last_updated"] = self.last_updated
+        return d
+
+
+@dataclass(slots=True)
+class SessionSummary:
     """Simple session summary model."""
 
     summary: str
     topics: Optional[List[str]] = None
-    last_updated: Optional[datetime] = None
-
-    def __post_init__(self):
-        if self.last_updated is None:
-            self.last_updated = datetime.now()
+    last_updated: Optional[datetime] = field(default_factory=datetime.now)
 
     def to_dict(self) -> Dict[str, Any]:
-        return self.model_dump(exclude_none=True)
+        d: Dict[str, Any] = {"summary": self.summary}
+        if self.topics is not None:
+            d["topics"] = self.topics
+        if self.last_updated is not None:
+            d["last_updated"] = self.last_updated
+        return d
+
+
+def _json_default(obj: Any) -> Any:
+    """orjson fallback for the objects held in a Memory store."""
+    if isinstance(obj, (UserMemory, SessionSummary)):
+        return obj.to_dict()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
 
 
 @dataclass
@@ -51,11 +66,13 @@ class Memory:
     # Simple in-memory storage
     memories: Dict[str, Dict[str, UserMemory]] = field(default_factory=dict)
     summaries: Dict[str, Dict[str, SessionSummary]] = field(default_factory=dict)
-    runs: Dict[str, List[Any]] = field(default_factory=dict)
+    # Each session keeps only its most recent ``run_history_limit`` runs
+    runs: Dict[str, Deque[Any]] = field(default_factory=dict)
 
     # Debug mode
     debug_mode: bool = False
     version: int = 2
+    run_history_limit: int = 1000
 
     def __post_init__(self):
         """Initialize memory after creation."""
@@ -67,34 +84,46 @@ class Memory:
         if memory.memory_id is None:
             memory.memory_id = str(uuid4())
 
-        if user_id not in self.memories:
-            self.memories[user_id] = {}
-
-        self.memories[user_id][memory.memory_id] = memory
+        # setdefault keeps concurrent first writes for a user from racing
+        self.memories.setdefault(user_id, {})[memory.memory_id] = memory
 
         if self.debug_mode:
             print(f"Added memory for user {user_id}: {memory.memory_id}")
 
         return memory.memory_id
 
-    def get_user_memories(self, user_id: str = "default") -> List[UserMemory]:
-        """Get all memories for a user."""
-        if user_id not in self.memories:
+    def get_user_memories(
+        self, user_id: str = "default", limit: Optional[int] = None
+    ) -> List[UserMemory]:
+        """Get a user's memories in insertion order.
+
+        With ``limit``, only the most recent ``limit`` memories are returned,
+        without walking the rest.
+        """
+        user_memories = self.memories.get(user_id)
+        if not user_memories:
             return []
-        return list(self.memories[user_id].values())
+        if limit is None:
+            return list(user_memories.values())
+        recent = list(islice(reversed(user_memories.values()), max(limit, 0)))
+        recent.reverse()
+        return recent
 
     def get_user_memory(
         self, memory_id: str, user_id: str = "default"
     ) -> Optional[UserMemory]:
         """Get a specific memory by ID."""
-        if user_id not in self.memories:
+        user_memories = self.memories.get(user_id)
+        if user_memories is None:
             return None
-        return self.memories[user_id].get(memory_id)
+        return user_memories.get(memory_id)
 
     def delete_user_memory(self, memory_id: str, user_id: str = "default") -> bool:
         """Delete a user memory."""
-        if user_id in self.memories and memory_id in self.memories[user_id]:
-            del self.memories[user_id][memory_id]
+        user_memories = self.memories.get(user_id)
+        if user_memories is None:
+            return False
+        if user_memories.pop(memory_id, None) is not None:
             if self.debug_mode:
                 print(f"Deleted memory {memory_id} for user {user_id}")
             return True
@@ -104,10 +133,7 @@ class Memory:
         self, session_id: str, summary: SessionSummary, user_id: str = "default"
     ) -> str:
         """Add a session summary."""
-        if user_id not in self.summaries:
-            self.summaries[user_id] = {}
-
-        self.summaries[user_id][session_id] = summary
+        self.summaries.setdefault(user_id, {})[session_id] = summary
 
         if self.debug_mode:
             print(f"Added session summary for user {user_id}, session {session_id}")
@@ -118,23 +144,27 @@ class Memory:
         self, session_id: str, user_id: str = "default"
     ) -> Optional[SessionSummary]:
         """Get a session summary."""
-        if user_id not in self.summaries:
+        session_summaries = self.summaries.get(user_id)
+        if session_summaries is None:
             return None
-        return self.summaries[user_id].get(session_id)
+        return session_summaries.get(session_id)
 
     def add_run(self, session_id: str, run: Any) -> None:
         """Add a run to memory."""
-        if session_id not in self.runs:
-            self.runs[session_id] = []
-
-        self.runs[session_id].append(run)
+        session_runs = self.runs.get(session_id)
+        if session_runs is None:
+            session_runs = self.runs.setdefault(
+                session_id, deque(maxlen=self.run_history_limit)
+            )
+        session_runs.append(run)
 
         if self.debug_mode:
             print(f"Added run to session {session_id}")
 
     def get_runs(self, session_id: str) -> List[Any]:
-        """Get all runs for a session."""
-        return self.runs.get(session_id, [])
+        """Get the retained runs for a session, oldest first."""
+        session_runs = self.runs.get(session_id)
+        return list(session_runs) if session_runs else []
 
     def clear(self) -> None:
         """Clear all memory."""
@@ -168,5 +198,26 @@ class Memory:
             },
         }
 
+    def to_json_bytes(self) -> bytes:
+        """Serialize memory straight to JSON bytes.
+
+        Produces the same structure as :meth:`to_dict` (with timestamps as
+        ISO 8601 strings). Records are still converted with their ``to_dict``,
+        but the nested containers are encoded by orjson directly.
+        """
+        return orjson.dumps(
+            {
+                "memories": self.memories,
+                "summaries": self.summaries,
+                # Runs are arbitrary objects, stored as text like in to_dict
+                "runs": {
+                    session_id: [str(run) for run in runs]
+                    for session_id, runs in self.runs.items()
+                },
+            },
+            default=_json_default,
+            option=orjson.OPT_PASSTHROUGH_DATACLASS,
+        )
+
     def __repr__(self) -> str:
         return f"Memory(users={len(self.memories)}, sessions={len(self.summaries)}, runs={len(self.runs)})"
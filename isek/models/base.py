@@ -1,31 +1,112 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
-
-
-@dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+from isek.models.cache import ResponseCache
+from isek.models.ratelimit import estimate_tokens, get_rate_limiter
+from isek.models.retry import aretrying, retrying
+from isek.utils.log import log
+
+T = TypeVar("T")
+
+# httpx.Limits for the keep-alive pools every provider shares across model
+# instances, so connections (and their TLS sessions) are reused
+HTTP_LIMITS = {
+    "max_connections": 64,
+    "max_keepalive_connections": 32,
+    "keepalive_expiry": 60.0,
+}
+
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    """Event loop shared by all sync callers of async model code.
+
+    Runs in a daemon thread for the lifetime of the process, so async clients
+    created on it stay bound to one loop across calls.
+    """
+    global _loop
+    loop = _loop
+    if loop is None:
+        # Double-checked so concurrent first callers cannot start two loops
+        with _loop_lock:
+            if _loop is None:
+                new_loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=new_loop.run_forever, name="isek-model-loop", daemon=True
+                ).start()
+                _loop = new_loop
+            loop = _loop
+    return loop
+
+
+# Marks tool pool threads; tool calls made from inside a tool (e.g. a tool
+# that runs another agent) execute inline there instead of waiting on a pool
+_tool_thread = threading.local()
+
+
+def _mark_tool_thread() -> None:
+    _tool_thread.active = True
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine on the shared background loop and wait for its result."""
+    return asyncio.run_coroutine_threadsafe(coro, _background_loop()).result()
+
+
+@dataclass(slots=True, frozen=True)
 class SimpleMessage:
-    """Ultra-simplified message model."""
+    """Ultra-simplified message model.
+
+    Messages are immutable once built, so the provider dict is computed on the
+    first :meth:`to_dict` call and reused by every later request that resends
+    the message (e.g. each step of a tool-calling loop).
+    """
 
     role: str
     content: Optional[str] = None
     name: Optional[str] = None
     tool_call_id: Optional[str] = None
     tool_calls: Optional[list] = None
+    _dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        d = {
-            "role": self.role,
-            "content": self.content,
-        }
-        if self.name:
-            d["name"] = self.name
-        if self.role == "tool" and self.tool_call_id:
-            d["tool_call_id"] = self.tool_call_id
-        if self.tool_calls is not None:
-            d["tool_calls"] = self.tool_calls
+        """Provider-format dict for this message; shared, so treat as read-only."""
+        d = self._dict
+        if d is None:
+            d = {
+                "role": self.role,
+                "content": self.content,
+            }
+            if self.name:
+                d["name"] = self.name
+            if self.role == "tool" and self.tool_call_id:
+                d["tool_call_id"] = self.tool_call_id
+            if self.tool_calls is not None:
+                d["tool_calls"] = self.tool_calls
+            object.__setattr__(self, "_dict", d)
         return d
 
 
@@ -55,6 +136,7 @@ class Model(ABC):
         id: str,
         name: Optional[str] = None,
         provider: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """Initialize the model.
 
@@ -62,17 +144,29 @@ class Model(ABC):
             id: The model ID
             name: The model name
             provider: The model provider
+            cache: Optional cache that serves repeated deterministic requests
         """
         self.id = id
         self.name = name or id
         self.provider = provider or "unknown"
+        self.cache = cache
 
         # Basic configuration
         self.supports_native_structured_outputs: bool = False
         self.supports_json_schema_outputs: bool = False
+        self.supports_json_mode: bool = False
         self.tool_message_role: str = "tool"
         self.assistant_message_role: str = "assistant"
 
+        # Retries for transient provider errors (see isek.models.retry)
+        self.max_retries: int = 2
+        self.retry_deadline: float = 60.0
+
+        # Tool calls from one assistant turn run on this model's own pool
+        self.max_tool_workers: int = 8
+        self._tool_pool: Optional[ThreadPoolExecutor] = None
+        self._tool_pool_lock = threading.Lock()
+
     def get_provider(self) -> str:
         """Get the provider name."""
         return self.provider
@@ -128,25 +222,28 @@ class Model(ABC):
             **kwargs: Additional arguments including:
                 - tools: List of tool schemas for the model
                 - toolkits: List of actual toolkits for execution
+                - parallel_tools: Set to False to run a turn's tool calls
+                  one after another (default True)
         Returns:
             Parsed model response
         """
+        # Not a provider argument; only controls local tool execution
+        parallel_tools = kwargs.pop("parallel_tools", True)
+
         # Check if tools are provided
         tools = kwargs.get("tools")
         toolkits = kwargs.get("toolkits", [])
 
         if not tools:
             # No tools, simple single call
-            raw_response = self.invoke(messages, **kwargs)
-            return self.parse_provider_response(raw_response, **kwargs)
+            return self._cached_response(messages, **kwargs)
 
         # Tools provided, handle tool calling loop internally
         messages_for_model = messages.copy()
 
         for _ in range(10):  # Prevent infinite loops
             # Call the model
-            raw_response = self.invoke(messages_for_model, **kwargs)
-            model_response = self.parse_provider_response(raw_response, **kwargs)
+            model_response = self._cached_response(messages_for_model, **kwargs)
 
             # If the model returns a final text response (no tool calls), return it
             if model_response.content and not model_response.tool_calls:
@@ -162,45 +259,12 @@ class Model(ABC):
                 )
                 messages_for_model.append(assistant_msg)
 
-                # Execute each tool call and add results
-                tool_messages = []
-                for tool_call in model_response.tool_calls:
-                    tool_name = tool_call.get("function", {}).get("name")
-                    tool_args = tool_call.get("function", {}).get("arguments")
-                    tool_call_id = tool_call.get("id")
-
-                    # Parse tool arguments
-                    if isinstance(tool_args, str):
-                        import json
-
-                        try:
-                            tool_args = json.loads(tool_args)
-                        except Exception:
-                            tool_args = {}
-                    if not isinstance(tool_args, dict):
-                        tool_args = {}
-
-                    # Execute the tool using the provided toolkits
-                    tool_result = self._execute_tool(tool_name, tool_args, toolkits)
-
-                    # Add tool result to conversation
-                    tool_msg = SimpleMessage(
-                        role="tool", content=str(tool_result), tool_call_id=tool_call_id
-                    )
-                    tool_messages.append(tool_msg)
-                # Find the last assistant message (with tool_calls)
-                last_assistant_idx = None
-                for i in range(len(messages_for_model) - 1, -1, -1):
-                    msg = messages_for_model[i]
-                    if getattr(msg, "role", None) == "assistant":
-                        last_assistant_idx = i
-                        break
-                if last_assistant_idx is not None:
-                    messages_for_model = (
-                        messages_for_model[: last_assistant_idx + 1] + tool_messages
-                    )
-                else:
-                    messages_for_model = messages_for_model + tool_messages
+                tool_messages = self._run_tool_calls(
+                    model_response.tool_calls, toolkits, parallel_tools
+                )
+                # The assistant message was just appended, so its results go
+                # straight after it; no need to search the history for it
+                messages_for_model.extend(tool_messages)
             else:
                 # If neither content nor tool_calls, return what we have
                 return model_response
@@ -208,6 +272,258 @@ class Model(ABC):
         # If we reach here, we hit the loop limit
         return model_response
 
+    def stream_text(self, messages: List[SimpleMessage], **kwargs) -> Iterator[str]:
+        """Yield the response text as it is generated.
+
+        Providers that support streaming override this to yield tokens as they
+        arrive; the default yields the complete response content at once.
+        Streams are not cached. Opening the stream is rate limited and retried
+        like :meth:`response`, but a stream that fails midway raises.
+
+        Args:
+            messages: List of messages to send to the model
+            **kwargs: Additional arguments
+
+        Returns:
+            Iterator over text fragments
+        """
+        content = self.parse_provider_response(
+            self._limited_call(messages, self.invoke, messages, **kwargs), **kwargs
+        ).content
+        if content:
+            yield content
+
+    async def astream_text(
+        self, messages: List[SimpleMessage], **kwargs
+    ) -> AsyncIterator[str]:
+        """Async counterpart of :meth:`stream_text`."""
+        content = self.parse_provider_response(
+            await self._alimited_call(messages, self.ainvoke, messages, **kwargs),
+            **kwargs,
+        ).content
+        if content:
+            yield content
+
+    def response_json(
+        self,
+        messages: List[SimpleMessage],
+        schema: Optional[Dict[str, Any]] = None,
+        schema_name: str = "output",
+        **kwargs,
+    ) -> Any:
+        """Generate a response and parse its content as JSON.
+
+        When ``schema`` is given and the model supports JSON-schema outputs, the
+        request uses ``response_format={"type": "json_schema", ...}`` so the
+        provider constrains decoding to valid, schema-conforming JSON and no
+        client-side repair or retry is needed. Without a schema, models that
+        support JSON mode get ``response_format={"type": "json_object"}`` as
+        long as the prompt mentions JSON. An explicit ``response_format``
+        argument is passed through unchanged.
+
+        Args:
+            messages: List of messages to send to the model
+            schema: Optional JSON schema the output must match
+            schema_name: Name reported to the provider for the schema
+            **kwargs: Additional arguments passed to :meth:`response`
+
+        Returns:
+            The decoded JSON value
+
+        Raises:
+            ValueError: If the response content is not valid JSON
+        """
+        if "response_format" not in kwargs:
+            response_format = self._json_response_format(messages, schema, schema_name)
+            if response_format is not None:
+                kwargs["response_format"] = response_format
+        model_response = self.response(messages, **kwargs)
+        try:
+            return json.loads(model_response.content or "")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Model response is not valid JSON: {e}") from e
+
+    def _json_response_format(
+        self,
+        messages: List[SimpleMessage],
+        schema: Optional[Dict[str, Any]],
+        schema_name: str,
+    ) -> Optional[Dict[str, Any]]:
+        """Pick the strictest JSON ``response_format`` this model accepts."""
+        if schema is not None and self.supports_json_schema_outputs:
+            return {
+                "type": "json_schema",
+                "json_schema": {"name": schema_name, "schema": schema, "strict": True},
+            }
+        # JSON mode is rejected unless the prompt itself asks for JSON
+        if self.supports_json_mode and any(
+            "json" in (msg.content or "").lower() for msg in messages
+        ):
+            return {"type": "json_object"}
+        return None
+
+    def _cache_lookup(
+        self, messages: List[SimpleMessage], kwargs: Dict[str, Any]
+    ) -> Tuple[Optional[str], Optional[SimpleModelResponse]]:
+        """Return the cache key for a request (None if uncacheable) and any hit."""
+        if self.cache is None or not ResponseCache.is_cacheable(kwargs):
+            return None, None
+        key = ResponseCache.cache_key(self.id, messages, kwargs)
+        cached = self.cache.get(key)
+        if cached is not None:
+            log.debug("Response cache hit for model [%s]", self.id)
+        return key, cached
+
+    def _cached_response(
+        self, messages: List[SimpleMessage], **kwargs
+    ) -> SimpleModelResponse:
+        """Invoke and parse one model call, going through ``self.cache`` if set.
+
+        Args:
+            messages: List of messages to send to the model
+            **kwargs: Additional arguments
+
+        Returns:
+            Parsed model response
+        """
+        key, cached = self._cache_lookup(messages, kwargs)
+        if cached is not None:
+            return cached
+
+        try:
+            raw_response = self._limited_call(messages, self.invoke, messages, **kwargs)
+        except Exception:
+            # Retries decide whether an error is fatal, so providers only warn
+            # per attempt; the final failure is logged here, with its traceback
+            log.error("Request to model [%s] failed", self.id, exc_info=True)
+            raise
+        model_response = self.parse_provider_response(raw_response, **kwargs)
+        if key is not None:
+            self.cache.set(key, model_response)
+        return model_response
+
+    def _call(self, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+        """Call ``func`` with the retry policy applied to :meth:`invoke`.
+
+        For provider calls that do not go through :meth:`response`, such as
+        opening a stream or managing a batch.
+        """
+        for attempt in retrying(self.max_retries, self.retry_deadline):
+            with attempt:
+                return func(*args, **kwargs)
+
+    async def _acall(
+        self, func: Callable[..., Awaitable[T]], /, *args: Any, **kwargs: Any
+    ) -> T:
+        """Async counterpart of :meth:`_call`."""
+        async for attempt in aretrying(self.max_retries, self.retry_deadline):
+            with attempt:
+                return await func(*args, **kwargs)
+
+    def _limited_call(
+        self,
+        messages: List[SimpleMessage],
+        func: Callable[..., T],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Like :meth:`_call`, but paced by the model's rate limiter.
+
+        ``messages`` is only used to estimate the request's token count.
+        """
+        # Shared per (provider, model) so concurrent agents pace together
+        limiter = get_rate_limiter(self.provider, self.id)
+        tokens = estimate_tokens(messages) if limiter is not None else 0
+        for attempt in retrying(self.max_retries, self.retry_deadline, limiter):
+            with attempt:
+                if limiter is not None:
+                    limiter.acquire(tokens)
+                return func(*args, **kwargs)
+
+    async def _alimited_call(
+        self,
+        messages: List[SimpleMessage],
+        func: Callable[..., Awaitable[T]],
+        /,
+        *args: Any,
+        **kwargs: Any,
+    ) -> T:
+        """Async counterpart of :meth:`_limited_call`."""
+        limiter = get_rate_limiter(self.provider, self.id)
+        tokens = estimate_tokens(messages) if limiter is not None else 0
+        async for attempt in aretrying(self.max_retries, self.retry_deadline, limiter):
+            with attempt:
+                if limiter is not None:
+                    await limiter.aacquire(tokens)
+                return await func(*args, **kwargs)
+
+    def _run_tool_calls(
+        self, tool_calls: List[Dict[str, Any]], toolkits: List, parallel: bool
+    ) -> List[SimpleMessage]:
+        """Execute a turn's tool calls, concurrently when that is safe.
+
+        Calls run on this model's pool only when there is more than one, the
+        caller allowed it, every toolkit is ``thread_safe`` and we are not
+        already on a tool pool thread (nested agent runs execute inline, so
+        they can never wait on a pool their own caller occupies). Results
+        keep the order of the calls.
+        """
+        if (
+            not parallel
+            or len(tool_calls) < 2
+            or getattr(_tool_thread, "active", False)
+            or not all(getattr(toolkit, "thread_safe", True) for toolkit in toolkits)
+        ):
+            return [self._run_tool_call(call, toolkits) for call in tool_calls]
+        return list(
+            self._get_tool_pool().map(
+                lambda call: self._run_tool_call(call, toolkits), tool_calls
+            )
+        )
+
+    def _get_tool_pool(self) -> ThreadPoolExecutor:
+        """Return this model's tool thread pool, creating it on first use."""
+        with self._tool_pool_lock:
+            if self._tool_pool is None:
+                self._tool_pool = ThreadPoolExecutor(
+                    max_workers=self.max_tool_workers,
+                    thread_name_prefix="isek-tool",
+                    initializer=_mark_tool_thread,
+                )
+            return self._tool_pool
+
+    def _run_tool_call(
+        self, tool_call: Dict[str, Any], toolkits: List
+    ) -> SimpleMessage:
+        """Execute one requested tool call and wrap its result as a tool message.
+
+        Args:
+            tool_call: Tool call as returned by the model
+            toolkits: List of toolkits to search for the tool
+
+        Returns:
+            Tool message answering the call
+        """
+        tool_name = tool_call.get("function", {}).get("name")
+        tool_args = tool_call.get("function", {}).get("arguments")
+        tool_call_id = tool_call.get("id")
+
+        # Parse tool arguments
+        if isinstance(tool_args, str):
+            try:
+                tool_args = json.loads(tool_args)
+            except Exception:
+                tool_args = {}
+        if not isinstance(tool_args, dict):
+            tool_args = {}
+
+        # Execute the tool using the provided toolkits
+        tool_result = self._execute_tool(tool_name, tool_args, toolkits)
+        return SimpleMessage(
+            role="tool", content=str(tool_result), tool_call_id=tool_call_id
+        )
+
     def _execute_tool(self, tool_name: str, tool_args: dict, toolkits: List) -> str:
         """Execute a tool by name with arguments using the provided toolkits.
 
@@ -221,9 +537,11 @@ class Model(ABC):
         """
         # Search for the tool in the provided toolkits
         for toolkit in toolkits:
-            if hasattr(toolkit, "functions") and tool_name in toolkit.functions:
+            # Single lookup per toolkit; the SimpleFunction entry carries the callable
+            function = getattr(toolkit, "functions", {}).get(tool_name)
+            if function is not None:
                 try:
-                    result = toolkit.execute_function(tool_name, **(tool_args or {}))
+                    result = toolkit.run_function(function, **(tool_args or {}))
                     return str(result)
                 except Exception as e:
                     return f"Error executing tool '{tool_name}': {e}"
@@ -242,11 +560,68 @@ class Model(ABC):
         Returns:
             Parsed model response
         """
+        key, cached = self._cache_lookup(messages, kwargs)
+        if cached is not None:
+            return cached
+
         # Get raw response from model (pass SimpleMessage objects directly)
-        raw_response = await self.ainvoke(messages, **kwargs)
+        try:
+            raw_response = await self._alimited_call(
+                messages, self.ainvoke, messages, **kwargs
+            )
+        except Exception:
+            log.error("Request to model [%s] failed", self.id, exc_info=True)
+            raise
 
         # Parse the response
-        return self.parse_provider_response(raw_response, **kwargs)
+        model_response = self.parse_provider_response(raw_response, **kwargs)
+        if key is not None:
+            self.cache.set(key, model_response)
+        return model_response
+
+    async def abatch_response(
+        self,
+        prompts: List[str],
+        max_concurrency: int = 10,
+        **kwargs,
+    ) -> List[Any]:
+        """Answer many independent prompts concurrently.
+
+        Each prompt is sent as a single user message through :meth:`aresponse`;
+        at most ``max_concurrency`` requests are in flight at once.
+
+        Args:
+            prompts: User prompts to answer
+            max_concurrency: Maximum number of concurrent requests
+            **kwargs: Additional arguments passed to every request
+
+        Returns:
+            One entry per prompt, in order: the parsed model response, or the
+            exception raised for that prompt
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _one(prompt: str) -> SimpleModelResponse:
+            async with semaphore:
+                return await self.aresponse(
+                    [SimpleMessage(role="user", content=prompt)], **kwargs
+                )
+
+        return await asyncio.gather(
+            *(_one(prompt) for prompt in prompts), return_exceptions=True
+        )
+
+    def batch_response(
+        self, prompts: List[str], max_concurrency: int = 10, **kwargs
+    ) -> List[Any]:
+        """Synchronous wrapper around :meth:`abatch_response`.
+
+        Runs on the shared background event loop, so it also works from
+        threads that already run their own loop.
+        """
+        return run_sync(
+            self.abatch_response(prompts, max_concurrency=max_concurrency, **kwargs)
+        )
 
     def _format_messages(self, messages: List[SimpleMessage]) -> List[Dict[str, Any]]:
         """Format messages for the model provider.
@@ -259,6 +634,30 @@ class Model(ABC):
         """
         return [msg.to_dict() for msg in messages]
 
+    def _build_params(
+        self, messages: List[SimpleMessage], kwargs: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the chat completion request parameters for a call.
+
+        Args:
+            messages: List of messages to send
+            kwargs: Call arguments; consumed, so pass a dict the caller owns
+
+        Returns:
+            Request parameters for the provider's chat completion API
+        """
+        # Toolkits are executed locally and are not a provider argument
+        kwargs.pop("toolkits", None)
+        # Only send 'tools' if present in kwargs and not empty
+        if not kwargs.get("tools"):
+            kwargs.pop("tools", None)
+        # Prepare request parameters in one dict build, without update/copy
+        return {
+            "model": self.id,
+            "messages": self._format_messages(messages),
+            **kwargs,
+        }
+
     def __repr__(self) -> str:
         return f"<{self.__class__.__name__} id='{self.id}' provider='{self.provider}'>"
 
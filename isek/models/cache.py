@@ -0,0 +1,102 @@
+"""In-process response cache for deterministic model calls."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from isek.models.base import SimpleMessage, SimpleModelResponse
+
+# Request arguments that never reach the provider and must not affect the key
+_UNKEYED_ARGS = frozenset({"toolkits"})
+
+
+class ResponseCache:
+    """LRU cache of parsed model responses keyed on the full request.
+
+    The key covers the model ID, every message and all provider arguments
+    (tools included), so only byte-identical requests share an entry.
+    Requests with a positive ``temperature`` or ``stream=True`` are never
+    cached. Subclass and override :meth:`get`/:meth:`set` to back the cache
+    with an external store.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None):
+        """Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of responses kept before evicting the least recently used
+            ttl: Optional lifetime of an entry in seconds; entries never expire if None
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[str, Tuple[float, SimpleModelResponse]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_cacheable(kwargs: Dict[str, Any]) -> bool:
+        """Whether a request with these arguments is deterministic enough to cache."""
+        return not kwargs.get("stream") and not kwargs.get("temperature")
+
+    @staticmethod
+    def cache_key(
+        model_id: str, messages: List[SimpleMessage], kwargs: Dict[str, Any]
+    ) -> str:
+        """Build a stable key for a request."""
+        payload = {
+            "model": model_id,
+            "messages": [msg.to_dict() for msg in messages],
+            "params": {k: v for k, v in kwargs.items() if k not in _UNKEYED_ARGS},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[SimpleModelResponse]:
+        """Return a copy of the cached response for ``key``, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None:
+                if time.monotonic() - entry[0] > self.ttl:
+                    del self._entries[key]
+                    entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        # Callers get their own object so they cannot alter the cached entry
+        return replace(entry[1])
+
+    def set(self, key: str, response: SimpleModelResponse) -> None:
+        """Store a copy of ``response`` under ``key``, evicting the oldest entry if full."""
+        # The caller keeps using ``response``; later edits must not reach the cache
+        entry = (time.monotonic(), replace(response))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss counters and the current number of entries."""
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        """Drop all entries and reset the hit/miss counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
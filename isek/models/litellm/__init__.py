@@ -1,5 +1,18 @@
-from isek.models.litellm.chat import LiteLLMModel
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isek.models.litellm.chat import LiteLLMModel
 
 __all__ = [
     "LiteLLMModel",
 ]
+
+
+def __getattr__(name):
+    # PEP 562: defer the litellm import until the model class is requested
+    if name == "LiteLLMModel":
+        from isek.models.litellm.chat import LiteLLMModel
+
+        globals()[name] = LiteLLMModel
+        return LiteLLMModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
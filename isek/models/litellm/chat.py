@@ -1,16 +1,51 @@
 """LiteLLM model implementation."""
 
+from __future__ import annotations
+
+import functools
 import os
-from typing import Any, List, Optional
-from litellm import completion
+from typing import Any, AsyncIterator, Iterator, List, Optional
 
-from isek.models.base import Model, SimpleMessage, SimpleModelResponse
+from isek.models.base import HTTP_LIMITS, Model, SimpleMessage, SimpleModelResponse
+from isek.models.cache import ResponseCache
 from isek.models.provider import PROVIDER_MAP, DEFAULT_PROVIDER
 from isek.utils.log import log
 
 
+def _install_shared_session() -> None:
+    """Give litellm a pooled keep-alive client unless the application set its own.
+
+    Only the sync session is installed here. litellm already caches its async
+    clients per event loop, so calls made through batch_response reuse the
+    pool on the shared background loop; a single ``aclient_session`` would
+    instead break for callers running their own loops.
+    """
+    import httpx
+    import litellm
+
+    if litellm.client_session is None:
+        litellm.client_session = httpx.Client(limits=httpx.Limits(**HTTP_LIMITS))
+
+
+@functools.lru_cache(maxsize=None)
+def _supports_response_schema(model_id: str, provider: str) -> bool:
+    """Whether litellm knows the model to accept ``json_schema`` response formats."""
+    import litellm
+
+    try:
+        return litellm.supports_response_schema(
+            model=model_id, custom_llm_provider=provider
+        )
+    except Exception:
+        return False
+
+
 class LiteLLMModel(Model):
-    """Ultra-simplified LiteLLM model implementation."""
+    """Ultra-simplified LiteLLM model implementation.
+
+    litellm loads its whole provider registry on import, so it is imported
+    when the first model is built rather than with this module.
+    """
 
     def __init__(
         self,
@@ -18,6 +53,7 @@ class LiteLLMModel(Model):
         model_id: Optional[str] = None,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """Initialize the LiteLLM model.
 
@@ -26,6 +62,7 @@ class LiteLLMModel(Model):
             model_id: The model ID (e.g., "gpt-3.5-turbo", "claude-3-sonnet")
             api_key: Optional API key for the provider (if required)
             base_url: Custom base URL for the API
+            cache: Optional ResponseCache for repeated deterministic requests
         """
         # Get provider with fallback
         _provider = provider or DEFAULT_PROVIDER
@@ -53,11 +90,14 @@ class LiteLLMModel(Model):
         _model_id = model_id or os.environ.get(model_env_key, default_model)
 
         # Initialize base class
-        super().__init__(id=_model_id, name=_model_id, provider=_provider)
+        super().__init__(id=_model_id, name=_model_id, provider=_provider, cache=cache)
 
         # Set capabilities
         self.supports_native_structured_outputs = True
-        self.supports_json_schema_outputs = True
+        self.supports_json_schema_outputs = _supports_response_schema(
+            _model_id, _provider
+        )
+        self.supports_json_mode = self.supports_json_schema_outputs
 
         # Store configuration
         self.api_key = None
@@ -73,6 +113,8 @@ class LiteLLMModel(Model):
             os.environ.get(base_url_env_key) if base_url_env_key else None
         )
 
+        _install_shared_session()
+
         log.info(f"LiteLLMModel initialized: {self.id} (provider: {_provider})")
 
     def invoke(self, messages: List[SimpleMessage], **kwargs: Any) -> Any:
@@ -85,39 +127,18 @@ class LiteLLMModel(Model):
         Returns:
             Raw ModelResponse
         """
-        # Convert SimpleMessage to LiteLLM format
-        formatted_messages = []
-        for msg in messages:
-            formatted_msg = {"role": msg.role, "content": msg.content}
-            if msg.name:
-                formatted_msg["name"] = msg.name
-            if msg.role == "tool" and msg.tool_call_id:
-                formatted_msg["tool_call_id"] = msg.tool_call_id
-            if msg.tool_calls is not None:
-                formatted_msg["tool_calls"] = msg.tool_calls
-            formatted_messages.append(formatted_msg)
-
-        # Prepare request parameters
-        params = {
-            "model": self.id,
-            "messages": formatted_messages,
-        }
-        # Only add 'tools' if present in kwargs and not None
-        if "tools" in kwargs and kwargs["tools"]:
-            params["tools"] = kwargs.pop("tools")
-        # Filter out 'toolkits' parameter as LiteLLM doesn't expect it
-        kwargs.pop("toolkits", None)
-        # Add any other kwargs
-        params.update(kwargs)
+        params = self._build_params(messages, kwargs)
+
+        log.debug("LiteLLM request: %s", self.id)
 
-        log.debug(f"LiteLLM request: {self.id}")
+        from litellm import completion
 
         try:
             response = completion(**params)
             log.debug("LiteLLM response received")
             return response
         except Exception as e:
-            log.error(f"LiteLLM API error: {e}")
+            log.warning("LiteLLM API error: %s", e)
             raise
 
     async def ainvoke(self, messages: List[SimpleMessage], **kwargs: Any) -> Any:
@@ -130,9 +151,61 @@ class LiteLLMModel(Model):
         Returns:
             Raw ModelResponse
         """
-        # For now, just call the sync version
-        # TODO: Implement proper async when needed
-        return self.invoke(messages, **kwargs)
+        params = self._build_params(messages, kwargs)
+
+        log.debug("LiteLLM async request: %s", self.id)
+
+        from litellm import acompletion
+
+        try:
+            response = await acompletion(**params)
+            log.debug("LiteLLM async response received")
+            return response
+        except Exception as e:
+            log.warning("LiteLLM API error: %s", e)
+            raise
+
+    def stream_text(
+        self, messages: List[SimpleMessage], **kwargs: Any
+    ) -> Iterator[str]:
+        """Stream the response text token by token.
+
+        Args:
+            messages: List of messages to send
+            **kwargs: Additional arguments for the API call
+
+        Returns:
+            Iterator over content deltas as they arrive
+        """
+        params = self._build_params(messages, kwargs)
+        params["stream"] = True
+
+        log.debug("LiteLLM streaming request: %s", self.id)
+
+        from litellm import completion
+
+        for chunk in self._limited_call(messages, completion, **params):
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    async def astream_text(
+        self, messages: List[SimpleMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Async counterpart of :meth:`stream_text`."""
+        params = self._build_params(messages, kwargs)
+        params["stream"] = True
+
+        log.debug("LiteLLM async streaming request: %s", self.id)
+
+        from litellm import acompletion
+
+        async for chunk in await self._alimited_call(messages, acompletion, **params):
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
 
     def parse_provider_response(
         self, response: Any, **kwargs: Any
@@ -1,5 +1,18 @@
-from isek.models.openai.openai import OpenAIModel
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isek.models.openai.openai import OpenAIModel
 
 __all__ = [
     "OpenAIModel",
 ]
+
+
+def __getattr__(name):
+    # PEP 562: defer the openai SDK import until the model class is requested
+    if name == "OpenAIModel":
+        from isek.models.openai.openai import OpenAIModel
+
+        globals()[name] = OpenAIModel
+        return OpenAIModel
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
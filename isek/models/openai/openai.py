@@ -1,13 +1,107 @@
 """OpenAI model implementation."""
 
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import json
 import os
-from typing import Any, List, Optional
-from openai import OpenAI
-from openai.types.chat import ChatCompletion
+import threading
+import weakref
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
 
-from isek.models.base import Model, SimpleMessage, SimpleModelResponse
+from isek.models.base import HTTP_LIMITS, Model, SimpleMessage, SimpleModelResponse
+from isek.models.cache import ResponseCache
 from isek.utils.log import log
 
+if TYPE_CHECKING:
+    import httpx
+    from openai import AsyncOpenAI, OpenAI
+    from openai.types.chat import ChatCompletion
+
+# Chat completion endpoint targeted by Batch API requests
+_BATCH_ENDPOINT = "/v1/chat/completions"
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_http_client() -> httpx.Client:
+    import httpx
+    from openai import DefaultHttpxClient
+
+    return DefaultHttpxClient(limits=httpx.Limits(**HTTP_LIMITS))
+
+
+# OpenAI clients shared by every model that targets the same endpoint with the
+# same credentials, keyed by (base_url, sha256(api_key)) so keys are not held
+# in the mapping. Async clients are additionally per event loop.
+_CLIENT_LOCK = threading.Lock()
+_CLIENTS: Dict[Tuple[Optional[str], str], OpenAI] = {}
+_ASYNC_CLIENTS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[Tuple[Optional[str], str], AsyncOpenAI]
+] = weakref.WeakKeyDictionary()
+
+
+def _client_key(
+    api_key: Optional[str], base_url: Optional[str]
+) -> Tuple[Optional[str], str]:
+    return base_url, hashlib.sha256((api_key or "").encode()).hexdigest()
+
+
+def _get_client(api_key: Optional[str], base_url: Optional[str]) -> OpenAI:
+    """Return the shared sync client for an endpoint, creating it on first use."""
+    key = _client_key(api_key, base_url)
+    with _CLIENT_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            from openai import OpenAI
+
+            # Retries are handled by Model with backoff + jitter; avoid doubling them.
+            # Calls that bypass Model.response (streams, batches) use Model._call.
+            client = OpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=_shared_http_client(),
+                max_retries=0,
+            )
+            _CLIENTS[key] = client
+    return client
+
+
+def _get_async_client(api_key: Optional[str], base_url: Optional[str]) -> AsyncOpenAI:
+    """Return the shared async client for an endpoint on the running event loop.
+
+    httpx async connections cannot move between loops, so clients are kept per
+    loop. Sync callers go through the shared background loop (see
+    ``run_sync``), which keeps this to one client per endpoint.
+    """
+    loop = asyncio.get_running_loop()
+    key = _client_key(api_key, base_url)
+    with _CLIENT_LOCK:
+        loop_clients = _ASYNC_CLIENTS.setdefault(loop, {})
+        client = loop_clients.get(key)
+        if client is None:
+            import httpx
+            from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+            client = AsyncOpenAI(
+                api_key=api_key,
+                base_url=base_url,
+                http_client=DefaultAsyncHttpxClient(limits=httpx.Limits(**HTTP_LIMITS)),
+                max_retries=0,
+            )
+            loop_clients[key] = client
+    return client
+
 
 class OpenAIModel(Model):
     """Ultra-simplified OpenAI model implementation."""
@@ -17,6 +111,7 @@ class OpenAIModel(Model):
         model_id: Optional[str] = None,
         api_key: Optional[str] = None,
         base_url: Optional[str] = None,
+        cache: Optional[ResponseCache] = None,
     ):
         """Initialize the OpenAI model.
 
@@ -24,22 +119,24 @@ class OpenAIModel(Model):
             model_id: The OpenAI model ID (e.g., "gpt-3.5-turbo", "gpt-4")
             api_key: OpenAI API key
             base_url: Custom base URL for the API
+            cache: Optional ResponseCache for repeated deterministic requests
         """
         # Get model ID with fallback
         _model_id = model_id or os.environ.get("OPENAI_MODEL_NAME", "gpt-3.5-turbo")
 
         # Initialize base class
-        super().__init__(id=_model_id, name=_model_id, provider="openai")
+        super().__init__(id=_model_id, name=_model_id, provider="openai", cache=cache)
 
         # Set capabilities
         self.supports_native_structured_outputs = True
         self.supports_json_schema_outputs = True
+        self.supports_json_mode = True
 
-        # Initialize OpenAI client
-        _api_key = api_key or os.environ.get("OPENAI_API_KEY")
-        _base_url = base_url or os.environ.get("OPENAI_BASE_URL")
-
-        self.client = OpenAI(api_key=_api_key, base_url=_base_url)
+        # Reuse the process-wide client for this endpoint; the SDK is only
+        # imported once a model is built
+        self._api_key = api_key or os.environ.get("OPENAI_API_KEY")
+        self._base_url = base_url or os.environ.get("OPENAI_BASE_URL")
+        self.client = _get_client(self._api_key, self._base_url)
 
         log.debug(f"OpenAIModel initialized: {self.id}")
 
@@ -53,41 +150,105 @@ class OpenAIModel(Model):
         Returns:
             Raw ChatCompletion response
         """
-        # Convert SimpleMessage to OpenAI format
-        formatted_messages = []
-        for msg in messages:
-            formatted_msg = {"role": msg.role, "content": msg.content}
-            if msg.name:
-                formatted_msg["name"] = msg.name
-            if msg.role == "tool" and msg.tool_call_id:
-                formatted_msg["tool_call_id"] = msg.tool_call_id
-            if msg.tool_calls is not None:
-                formatted_msg["tool_calls"] = msg.tool_calls
-            formatted_messages.append(formatted_msg)
-
-        # Prepare request parameters
-        params = {
-            "model": self.id,
-            "messages": formatted_messages,
-        }
-        # Only add 'tools' if present in kwargs and not None
-        if "tools" in kwargs and kwargs["tools"]:
-            params["tools"] = kwargs.pop("tools")
-        # Filter out 'toolkits' parameter as OpenAI doesn't expect it
-        kwargs.pop("toolkits", None)
-        # Add any other kwargs
-        params.update(kwargs)
+        params = self._build_params(messages, kwargs)
 
-        log.debug(f"OpenAI request: {self.id}")
+        log.debug("OpenAI request: %s", self.id)
 
         try:
             response = self.client.chat.completions.create(**params)
-            log.debug(f"OpenAI response: {response.id}")
+            log.debug("OpenAI response: %s", response.id)
             return response
         except Exception as e:
-            log.error(f"OpenAI API error: {e}")
+            log.warning("OpenAI API error: %s", e)
             raise
 
+    def submit_batch(self, prompts: List[str], **kwargs: Any) -> str:
+        """Queue independent prompts on the OpenAI Batch API.
+
+        Batch requests are billed at a discount and do not count against the
+        regular rate limits, but complete asynchronously within 24 hours. Use
+        :meth:`retrieve_batch` to collect the results.
+
+        Args:
+            prompts: User prompts, each sent as its own chat completion request
+            **kwargs: Additional arguments applied to every request
+
+        Returns:
+            The batch ID
+        """
+        lines = []
+        for index, prompt in enumerate(prompts):
+            body = self._build_params(
+                [SimpleMessage(role="user", content=prompt)], dict(kwargs)
+            )
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": f"request-{index}",
+                        "method": "POST",
+                        "url": _BATCH_ENDPOINT,
+                        "body": body,
+                    }
+                )
+            )
+
+        batch_file = self._call(
+            self.client.files.create,
+            file=("batch.jsonl", "\n".join(lines).encode()),
+            purpose="batch",
+        )
+        batch = self._call(
+            self.client.batches.create,
+            input_file_id=batch_file.id,
+            endpoint=_BATCH_ENDPOINT,
+            completion_window="24h",
+        )
+        log.debug("OpenAI batch submitted: %s (%d requests)", batch.id, len(prompts))
+        return batch.id
+
+    def retrieve_batch(
+        self, batch_id: str
+    ) -> Optional[List[Optional[SimpleModelResponse]]]:
+        """Collect the results of a batch queued with :meth:`submit_batch`.
+
+        Args:
+            batch_id: The ID returned by :meth:`submit_batch`
+
+        Returns:
+            None while the batch is still running; otherwise one parsed response
+            per submitted prompt, in order, with None for requests that failed
+
+        Raises:
+            RuntimeError: If the batch failed, expired or was cancelled
+        """
+        from openai.types.chat import ChatCompletion
+
+        batch = self._call(self.client.batches.retrieve, batch_id)
+        if batch.status in ("failed", "expired", "cancelled"):
+            raise RuntimeError(
+                f"OpenAI batch {batch_id} ended with status {batch.status}"
+            )
+        if batch.status != "completed":
+            return None
+
+        results = {}
+        if batch.output_file_id:
+            content = self._call(self.client.files.content, batch.output_file_id).text
+            for line in content.splitlines():
+                if not line:
+                    continue
+                record = json.loads(line)
+                index = int(record["custom_id"].rsplit("-", 1)[1])
+                response = record.get("response") or {}
+                if response.get("status_code") == 200:
+                    results[index] = self.parse_provider_response(
+                        ChatCompletion.model_validate(response["body"])
+                    )
+
+        total = batch.request_counts.total if batch.request_counts else 0
+        total = max(total, max(results, default=-1) + 1)
+        return [results.get(index) for index in range(total)]
+
     async def ainvoke(
         self, messages: List[SimpleMessage], **kwargs: Any
     ) -> ChatCompletion:
@@ -100,9 +261,65 @@ class OpenAIModel(Model):
         Returns:
             Raw ChatCompletion response
         """
-        # For now, just call the sync version
-        # TODO: Implement proper async when needed
-        return self.invoke(messages, **kwargs)
+        params = self._build_params(messages, kwargs)
+
+        log.debug("OpenAI async request: %s", self.id)
+
+        try:
+            response = await _get_async_client(
+                self._api_key, self._base_url
+            ).chat.completions.create(**params)
+            log.debug("OpenAI async response: %s", response.id)
+            return response
+        except Exception as e:
+            log.warning("OpenAI API error: %s", e)
+            raise
+
+    def stream_text(
+        self, messages: List[SimpleMessage], **kwargs: Any
+    ) -> Iterator[str]:
+        """Stream the response text token by token.
+
+        Args:
+            messages: List of messages to send
+            **kwargs: Additional arguments for the API call
+
+        Returns:
+            Iterator over content deltas as they arrive
+        """
+        params = self._build_params(messages, kwargs)
+        params["stream"] = True
+
+        log.debug("OpenAI streaming request: %s", self.id)
+
+        # Only opening the stream is retried; a stream that fails midway raises
+        stream = self._limited_call(
+            messages, self.client.chat.completions.create, **params
+        )
+        for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+
+    async def astream_text(
+        self, messages: List[SimpleMessage], **kwargs: Any
+    ) -> AsyncIterator[str]:
+        """Async counterpart of :meth:`stream_text`."""
+        params = self._build_params(messages, kwargs)
+        params["stream"] = True
+
+        log.debug("OpenAI async streaming request: %s", self.id)
+
+        client = _get_async_client(self._api_key, self._base_url)
+        stream = await self._alimited_call(
+            messages, client.chat.completions.create, **params
+        )
+        async for chunk in stream:
+            if chunk.choices:
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
 
     def parse_provider_response(
         self, response: ChatCompletion, **kwargs: Any
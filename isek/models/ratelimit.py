@@ -0,0 +1,147 @@
+"""Client-side request pacing for model providers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from isek.models.base import SimpleMessage
+
+# Fraction of the configured rate kept after each 429, and how long the
+# provider has to stay quiet before the configured rate is restored
+_BACKOFF_FACTOR = 0.8
+_RECOVERY_WINDOW = 60.0
+
+
+class _Bucket:
+    """Token bucket refilled continuously at ``per_minute / 60`` per second."""
+
+    __slots__ = ("per_minute", "rate", "capacity", "level", "updated")
+
+    def __init__(self, per_minute: float):
+        self.per_minute = per_minute
+        self.rate = per_minute / 60.0
+        # Allow bursts of up to six seconds' worth of budget
+        self.capacity = max(per_minute / 10.0, 1.0)
+        self.level = self.capacity
+        self.updated = time.monotonic()
+
+    def reserve(self, amount: float, now: float) -> float:
+        """Take ``amount`` from the bucket and return how long to wait for it.
+
+        The level may go negative, so concurrent callers queue up behind
+        each other instead of all waking at the same instant. A request larger
+        than the bucket only waits for a full bucket, but is charged in full,
+        so the callers after it wait off the excess.
+        """
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+        shortfall = min(amount, self.capacity) - self.level
+        self.level -= amount
+        return max(shortfall, 0.0) / self.rate
+
+    def scale(self, factor: float) -> None:
+        self.rate = self.per_minute / 60.0 * factor
+
+
+class RateLimiter:
+    """Paces requests to stay under a provider's requests/tokens per minute.
+
+    Each call reserves one request and its estimated token count; callers
+    sleep until both budgets allow it. On a 429 the rates are lowered by
+    20% (repeatedly, for repeated 429s) and restored once the provider has
+    not rate limited us for a minute.
+    """
+
+    def __init__(self, rpm: Optional[float] = None, tpm: Optional[float] = None):
+        """Initialize the limiter.
+
+        Args:
+            rpm: Requests per minute, or None for no request limit
+            tpm: Tokens per minute, or None for no token limit
+        """
+        self._requests = _Bucket(rpm) if rpm else None
+        self._tokens = _Bucket(tpm) if tpm else None
+        self._factor = 1.0
+        self._throttled_at = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: int = 0) -> float:
+        """Reserve budget for one request and return the delay before sending it."""
+        now = time.monotonic()
+        with self._lock:
+            if self._factor < 1.0 and now - self._throttled_at > _RECOVERY_WINDOW:
+                self._set_factor(1.0)
+            delay = 0.0
+            if self._requests is not None:
+                delay = self._requests.reserve(1, now)
+            if self._tokens is not None:
+                delay = max(delay, self._tokens.reserve(tokens, now))
+        return delay
+
+    def acquire(self, tokens: int = 0) -> None:
+        """Block until a request of ``tokens`` tokens may be sent."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+
+    async def aacquire(self, tokens: int = 0) -> None:
+        """Async counterpart of :meth:`acquire`."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def throttle(self) -> None:
+        """Record a 429 from the provider and slow down."""
+        with self._lock:
+            self._throttled_at = time.monotonic()
+            self._set_factor(self._factor * _BACKOFF_FACTOR)
+            # Spend any saved-up burst so the next calls go out at the new rate
+            for bucket in (self._requests, self._tokens):
+                if bucket is not None:
+                    bucket.level = min(bucket.level, 0.0)
+
+    def _set_factor(self, factor: float) -> None:
+        self._factor = factor
+        for bucket in (self._requests, self._tokens):
+            if bucket is not None:
+                bucket.scale(factor)
+
+
+def estimate_tokens(messages: List[SimpleMessage]) -> int:
+    """Rough prompt size in tokens (about four characters per token)."""
+    return sum(len(msg.content or "") for msg in messages) // 4 + 1
+
+
+# One limiter per (provider, model ID), shared by every model instance
+_LIMITERS: Dict[Tuple[str, str], RateLimiter] = {}
+
+
+def set_rate_limit(
+    provider: str,
+    model_id: str,
+    rpm: Optional[float] = None,
+    tpm: Optional[float] = None,
+) -> RateLimiter:
+    """Limit all calls to ``model_id`` on ``provider`` to the given rates.
+
+    Args:
+        provider: Provider name as reported by ``Model.provider``
+        model_id: Model ID as reported by ``Model.id``
+        rpm: Requests per minute, or None for no request limit
+        tpm: Tokens per minute, or None for no token limit
+
+    Returns:
+        The limiter now in effect for that model
+    """
+    limiter = RateLimiter(rpm=rpm, tpm=tpm)
+    _LIMITERS[(provider, model_id)] = limiter
+    return limiter
+
+
+def get_rate_limiter(provider: str, model_id: str) -> Optional[RateLimiter]:
+    """Return the limiter configured for a model, or None if it is unlimited."""
+    return _LIMITERS.get((provider, model_id))
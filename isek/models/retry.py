@@ -0,0 +1,136 @@
+"""Retry policy for transient model provider errors."""
+
+from __future__ import annotations
+
+import functools
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Optional, Tuple, Type
+
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    Retrying,
+    retry_if_exception,
+    stop_after_attempt,
+    stop_after_delay,
+    wait_random_exponential,
+)
+from tenacity.wait import wait_base
+
+if TYPE_CHECKING:
+    from isek.models.ratelimit import RateLimiter
+
+
+@functools.lru_cache(maxsize=1)
+def _error_types() -> Tuple[Type[BaseException], Type[BaseException]]:
+    # The SDK is imported on first use to keep ``isek.models`` light
+    from openai import APIConnectionError, APIStatusError
+
+    return APIConnectionError, APIStatusError
+
+
+def is_transient(exc: BaseException) -> bool:
+    """Whether a provider error is worth retrying.
+
+    Connection failures and timeouts are retried, as are 408, 409, 429 and
+    5xx responses. Other client errors, such as 400 Bad Request, are not.
+    litellm raises subclasses of the OpenAI SDK errors, so this covers both
+    providers.
+    """
+    connection_error, status_error = _error_types()
+    if isinstance(exc, connection_error):
+        return True
+    if isinstance(exc, status_error):
+        return exc.status_code in (408, 409, 429) or exc.status_code >= 500
+    return False
+
+
+# Longest provider-requested wait we honor before falling back to backoff
+_MAX_RETRY_AFTER = 60.0
+
+
+def retry_after(exc: BaseException) -> Optional[float]:
+    """Seconds the provider asked us to wait before retrying, if it said.
+
+    Reads ``retry-after-ms`` (sent by OpenAI) or the standard ``Retry-After``
+    header, which may hold either seconds or an HTTP date.
+    """
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        millis = headers.get("retry-after-ms")
+        if millis is not None:
+            return float(millis) / 1000
+        value = headers.get("retry-after")
+        if value is None:
+            return None
+        try:
+            return float(value)
+        except ValueError:
+            return parsedate_to_datetime(value).timestamp() - time.time()
+    except (TypeError, ValueError):
+        return None
+
+
+class _wait_retry_after(wait_base):
+    """Wait as long as the provider asked, else defer to ``fallback``."""
+
+    def __init__(self, fallback: wait_base):
+        self.fallback = fallback
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        delay = retry_after(retry_state.outcome.exception())
+        if delay is not None and 0 <= delay <= _MAX_RETRY_AFTER:
+            return delay
+        return self.fallback(retry_state)
+
+
+def _throttle_on_429(limiter: RateLimiter):
+    def after(retry_state: RetryCallState) -> None:
+        exc = retry_state.outcome.exception()
+        if getattr(exc, "status_code", None) == 429:
+            limiter.throttle()
+
+    return after
+
+
+# Full-jitter exponential backoff: a random wait of up to 0.5s, 1s, 2s, ...
+# capped at 30s. Stateless, so one instance serves every retry controller.
+_BACKOFF = _wait_retry_after(wait_random_exponential(multiplier=0.5, max=30))
+_RETRY = retry_if_exception(is_transient)
+
+
+@functools.lru_cache(maxsize=64)
+def _policy(max_retries: int, deadline: float, limiter: Optional[RateLimiter]) -> dict:
+    # Cached per model configuration; the controllers only read this dict
+    policy = {
+        "stop": stop_after_attempt(max_retries + 1) | stop_after_delay(deadline),
+        "wait": _BACKOFF,
+        "retry": _RETRY,
+        "reraise": True,
+    }
+    if limiter is not None:
+        policy["after"] = _throttle_on_429(limiter)
+    return policy
+
+
+def retrying(
+    max_retries: int, deadline: float, limiter: Optional[RateLimiter] = None
+) -> Retrying:
+    """Sync retry controller with full-jitter exponential backoff.
+
+    A ``Retry-After`` header on the error takes precedence over the backoff.
+
+    If ``limiter`` is given, every 429 slows it down (see
+    :meth:`RateLimiter.throttle`).
+    """
+    return Retrying(**_policy(max_retries, deadline, limiter))
+
+
+def aretrying(
+    max_retries: int, deadline: float, limiter: Optional[RateLimiter] = None
+) -> AsyncRetrying:
+    """Async counterpart of :func:`retrying`."""
+    return AsyncRetrying(**_policy(max_retries, deadline, limiter))
@@ -45,6 +45,9 @@ class IsekCenterRegistry(Registry):
             raise ValueError(f"Invalid port number for Isek Center: {port}")
 
         self.center_address: str = f"http://{host}:{port}"
+        # Local copy of the center's node list, kept current via version deltas
+        self._nodes_cache: Dict[str, NodeInfo] = {}
+        self._nodes_version: Optional[str] = None
         # self.node_info: NodeInfo = {} # This instance variable seems to store the last registered node's info
         # by this instance, which might be confusing if multiple nodes use
         # the same registry instance. Consider if this state is necessary at instance level.
@@ -206,6 +209,9 @@ class IsekCenterRegistry(Registry):
         Sends a GET request to the center's `/isek_center/available_nodes` endpoint.
         The expected response structure from Isek Center is a JSON object with a 'data' key,
         which in turn has an 'available_nodes' key containing the dictionary of nodes.
+        After the first call, the version tag from the previous response is sent as
+        ``since`` and the center may reply with only the nodes 'added' and 'removed'
+        since then, which are applied to a locally cached copy.
 
         :return: A dictionary where keys are node IDs and values are dictionaries
                  containing the node information (host, port, metadata, etc.)
@@ -217,12 +223,25 @@ class IsekCenterRegistry(Registry):
         available_nodes_url = f"{self.center_address}/isek_center/available_nodes"
         try:
             log.debug(f"Fetching available nodes from {available_nodes_url}")
+            params = {"since": self._nodes_version} if self._nodes_version else None
             response = requests.get(
-                url=available_nodes_url, timeout=10
+                url=available_nodes_url, params=params, timeout=10
             )  # Added timeout
             response_data = self._handle_response(response, "get available nodes")
 
-            nodes_data = response_data.get("data", {}).get("available_nodes")
+            data = response_data.get("data") or {}
+            if "available_nodes" not in data and "added" in data:
+                self._nodes_cache.update(data["added"])
+                for node_id in data.get("removed", []):
+                    self._nodes_cache.pop(node_id, None)
+                self._nodes_version = data.get("version")
+                log.debug(
+                    f"Applied node delta: {len(data['added'])} added, "
+                    f"{len(data.get('removed', []))} removed."
+                )
+                return dict(self._nodes_cache)
+
+            nodes_data = data.get("available_nodes")
             if nodes_data is None or not isinstance(nodes_data, dict):
                 log.error(
                     "Isek Center response for available nodes is missing 'data.available_nodes' "
@@ -231,8 +250,10 @@ class IsekCenterRegistry(Registry):
                 raise RuntimeError(
                     "Invalid data structure for available nodes received from Isek Center."
                 )
+            self._nodes_cache = nodes_data
+            self._nodes_version = data.get("version")
             log.debug(f"Successfully fetched {len(nodes_data)} available nodes.")
-            return nodes_data  # type: ignore # If linter complains about Dict[str, NodeInfo] vs Dict[str, Any]
+            return dict(nodes_data)
         except RequestException as e:
             log.error(
                 f"Failed to get available nodes due to a network/HTTP error: {e}",
@@ -429,10 +429,7 @@ class IsekTeam:
             if isinstance(member, IsekAgent):
                 if member.tools:
                     for toolkit in member.tools:
-                        for func in toolkit.functions.values():
-                            tools.append(
-                                {"type": "function", "function": func.to_dict()}
-                            )
+                        tools.extend(toolkit.tool_schemas())
             elif isinstance(member, IsekTeam):
                 tools.extend(member.get_available_tools())
         return tools
@@ -42,6 +42,8 @@ class FastMCPToolkit(Toolkit):
             tools=[],
             auto_register=False,
             debug=debug,
+            # Calls share one fastmcp Client, entered from a fresh loop per call
+            thread_safe=False,
         )
 
         if auto_register:
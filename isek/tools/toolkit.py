@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 from isek.utils.log import log
@@ -35,6 +36,18 @@ class SimpleFunction:
 class Toolkit:
     """Ultra-simplified Toolkit class with minimal features."""
 
+    # Toolkits are created per agent; subclasses that need extra attributes
+    # simply omit __slots__ and get a regular __dict__.
+    __slots__ = (
+        "name",
+        "tools",
+        "functions",
+        "instructions",
+        "debug",
+        "thread_safe",
+        "_schemas",
+    )
+
     def __init__(
         self,
         name: str = "toolkit",
@@ -42,6 +55,7 @@ class Toolkit:
         instructions: Optional[str] = None,
         auto_register: bool = True,
         debug: bool = False,
+        thread_safe: bool = True,
     ):
         """Initialize a new Toolkit.
 
@@ -51,12 +65,17 @@ class Toolkit:
             instructions: Instructions for the toolkit
             auto_register: Whether to automatically register all tools
             debug: Enable debug output
+            thread_safe: Whether functions may run concurrently when a model
+                requests several tool calls in one turn
         """
         self.name: str = name
         self.tools: List[Callable] = tools or []
         self.functions: Dict[str, SimpleFunction] = {}
         self.instructions: Optional[str] = instructions
         self.debug: bool = debug
+        self.thread_safe: bool = thread_safe
+        # Model-facing tool schemas, built on first use and reset on register
+        self._schemas: Optional[List[Dict[str, Any]]] = None
 
         # Automatically register all tools if auto_register is True
         if auto_register and self.tools:
@@ -80,6 +99,10 @@ class Toolkit:
             The registered SimpleFunction
         """
         tool_name = name or function.__name__
+        existing = self.functions.get(tool_name)
+        if existing is not None and existing.entrypoint is function:
+            # Re-registering the same callable is a no-op; skip the schema rebuild
+            return existing
         schema = function_to_schema(function)
         parameters = schema["function"][
             "parameters"
@@ -91,31 +114,54 @@ class Toolkit:
             parameters=parameters,
         )
         self.functions[tool_name] = simple_function
+        self._schemas = None
         if self.debug:
-            log.debug(f"[Toolkit: {self.name}] Registered function: {tool_name}")
+            log.debug("[Toolkit: %s] Registered function: %s", self.name, tool_name)
         return simple_function
 
     def get_function(self, name: str) -> Optional[SimpleFunction]:
         """Get a function by name."""
         return self.functions.get(name)
 
+    def tool_schemas(self) -> List[Dict[str, Any]]:
+        """Tool schemas for every registered function, in model request format.
+
+        The schemas are built once and reused until another function is
+        registered; treat the returned dicts as read-only.
+        """
+        if self._schemas is None:
+            self._schemas = [
+                {"type": "function", "function": func.to_dict()}
+                for func in self.functions.values()
+            ]
+        return list(self._schemas)
+
     def list_functions(self) -> List[str]:
         """List all registered function names."""
-        if self.debug:
-            log.debug(f"[Toolkit: {self.name}] Listing functions:")
+        if self.debug and log.isEnabledFor(logging.DEBUG):
+            log.debug("[Toolkit: %s] Listing functions:", self.name)
             for fname in self.functions:
-                log.debug(f"  - {fname}")
+                log.debug("  - %s", fname)
         return list(self.functions.keys())
 
-    def execute_function(self, name: str, **kwargs) -> Any:
+    def execute_function(self, name: str, /, **kwargs) -> Any:
         """Execute a function by name."""
-        function = self.get_function(name)
+        function = self.functions.get(name)
         if function is None:
             raise ValueError(f"Function '{name}' not found in toolkit '{self.name}'")
+        return self.run_function(function, **kwargs)
+
+    def run_function(self, function: SimpleFunction, /, **kwargs) -> Any:
+        """Execute an already looked-up function of this toolkit."""
         result = function.execute(**kwargs)
         if self.debug:
+            # Lazy %-formatting: the args/result reprs are only built if emitted
             log.debug(
-                f"[Toolkit: {self.name}] Executed '{name}' with args {kwargs} -> {result}"
+                "[Toolkit: %s] Executed '%s' with args %s -> %s",
+                self.name,
+                function.name,
+                kwargs,
+                result,
             )
         return result
 
@@ -2,13 +2,18 @@ import inspect
 import re
 import json
 import hashlib
+import functools
+import types
 from typing import (
     Callable,
     Any,
     List,
     Dict,
     Optional,
+    Tuple,
     Union,
+    get_args,
+    get_origin,
 )  # Added more specific types
 
 # --- Type Aliases for Clarity ---
@@ -19,6 +24,89 @@ ChunkedListType = List[List[Any]]  # Generic chunked list for split_list output
 DictContent = Dict[str, Any]
 ExcludeFields = Optional[List[str]]
 
+_NONE_TYPE = type(None)
+_EMPTY = inspect.Parameter.empty
+
+# Python type -> JSON schema type, shared by every function_to_schema call.
+_TYPE_MAP: Dict[type, str] = {
+    str: "string",
+    int: "integer",
+    float: "number",
+    bool: "boolean",
+    list: "array",  # Note: Does not specify item types for the array.
+    dict: "object",  # Note: Does not specify properties for the object.
+    _NONE_TYPE: "null",  # For NoneType
+}
+
+
+@functools.lru_cache(maxsize=256)
+def _parameters_schema(
+    fingerprint: Tuple[Tuple[str, Any, Any, Any], ...],
+) -> Tuple[Dict[str, Dict[str, str]], Tuple[str, ...]]:
+    """
+    Builds the parameter properties and sorted required names for a signature.
+
+    :param fingerprint: One ``(name, kind, annotation, default_repr)`` tuple per
+                        parameter, where ``default_repr`` is ``Parameter.empty``
+                        for parameters without a default.
+    :type fingerprint: typing.Tuple
+    :return: The properties mapping and the sorted tuple of required names.
+    :rtype: typing.Tuple[typing.Dict[str, typing.Dict[str, str]], typing.Tuple[str, ...]]
+    """
+    type_map = _TYPE_MAP
+
+    parameters_properties: Dict[str, Dict[str, str]] = {}
+    required: List[str] = []
+    for name, kind, param_type_annotation, default_repr in fingerprint:
+        # Skip varargs/varkwargs for simplicity in schema
+        if kind in (
+            inspect.Parameter.VAR_POSITIONAL,
+            inspect.Parameter.VAR_KEYWORD,
+        ):
+            continue
+        # Ensure self is not in required
+        if default_repr is _EMPTY and name != "self":
+            required.append(name)
+        # Skip 'self' for methods
+        if name == "self" and kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            continue
+
+        json_type: str = "string"  # Default type if annotation is missing or unmappable
+
+        # Handle Optional[T] (which is Union[T, NoneType]), Union[T, None] and
+        # PEP 604 `T | None` by extracting the non-NoneType part for the schema type.
+        # The 'required' list will handle if the parameter itself is optional.
+        origin = get_origin(param_type_annotation)
+        if origin is Union or origin is types.UnionType:
+            # Filter out NoneType for Optional fields
+            union_args = [
+                arg for arg in get_args(param_type_annotation) if arg is not _NONE_TYPE
+            ]
+            if len(union_args) == 1:  # This was Optional[X] or Union[X, None]
+                param_type_annotation = union_args[0]
+            # else: complex Union, defaults to "string" or requires more sophisticated handling
+
+        if param_type_annotation is not _EMPTY:
+            json_type = type_map.get(
+                param_type_annotation, "string"
+            )  # Default to string if type not in map
+
+        # Create a basic description for the parameter
+        param_description = f"Parameter '{name}'."
+        # Adding type information to description can be helpful for LLMs
+        if param_type_annotation is not _EMPTY:
+            param_description += f" Expected type: {getattr(param_type_annotation, '__name__', str(param_type_annotation))}."
+        if default_repr is not _EMPTY:
+            param_description += f" Default value: {default_repr}."
+
+        parameters_properties[name] = {
+            "type": json_type,
+            "description": param_description.strip(),
+        }
+
+    # Sort for consistent schema output
+    return parameters_properties, tuple(sorted(required))
+
 
 def function_to_schema(func: Callable[..., Any]) -> FunctionSchema:
     """
@@ -45,16 +133,6 @@ def function_to_schema(func: Callable[..., Any]) -> FunctionSchema:
                         or if a parameter's type annotation is of a type that
                         cannot be directly mapped and is not a common built-in.
     """
-    type_map: Dict[type, str] = {
-        str: "string",
-        int: "integer",
-        float: "number",
-        bool: "boolean",
-        list: "array",  # Note: Does not specify item types for the array.
-        dict: "object",  # Note: Does not specify properties for the object.
-        type(None): "null",  # For NoneType
-    }
-
     try:
         signature = inspect.signature(func)
     except ValueError as e:  # e.g., for built-in functions in C
@@ -62,64 +140,21 @@ def function_to_schema(func: Callable[..., Any]) -> FunctionSchema:
             f"Failed to get signature for function '{func.__name__}': {e}"
         ) from e
 
-    parameters_properties: Dict[str, Dict[str, str]] = {}
-    for param in signature.parameters.values():
-        # Skip 'self' for methods, and varargs/varkwargs for simplicity in schema
-        if (
-            param.name == "self"
-            and param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD
-        ):
-            continue
-        if param.kind in (
-            inspect.Parameter.VAR_POSITIONAL,
-            inspect.Parameter.VAR_KEYWORD,
-        ):
-            continue
-
-        param_type_annotation = param.annotation
-        json_type: str = "string"  # Default type if annotation is missing or unmappable
-
-        # Handle Optional[T] (which is Union[T, NoneType]) and Union[T, None]
-        # by extracting the non-NoneType part for the schema type.
-        # The 'required' list will handle if the parameter itself is optional.
-        if (
-            hasattr(param_type_annotation, "__origin__")
-            and param_type_annotation.__origin__ is Union
-        ):
-            # Filter out NoneType for Optional fields
-            union_args = [
-                arg for arg in param_type_annotation.__args__ if arg is not type(None)
-            ]
-            if len(union_args) == 1:  # This was Optional[X] or Union[X, None]
-                param_type_annotation = union_args[0]
-            # else: complex Union, defaults to "string" or requires more sophisticated handling
-
-        if param_type_annotation is not inspect.Parameter.empty:
-            json_type = type_map.get(
-                param_type_annotation, "string"
-            )  # Default to string if type not in map
-
-        # Create a basic description for the parameter
-        param_description = f"Parameter '{param.name}'."
-        # Adding type information to description can be helpful for LLMs
-        if param_type_annotation is not inspect.Parameter.empty:
-            param_description += f" Expected type: {getattr(param_type_annotation, '__name__', str(param_type_annotation))}."
-        if param.default != inspect.Parameter.empty:
-            param_description += f" Default value: {param.default!r}."
-
-        parameters_properties[param.name] = {
-            "type": json_type,
-            "description": param_description.strip(),
-        }
-
-    required: List[str] = [
-        param.name
+    # Structurally identical signatures (e.g. many tools taking `query: str`)
+    # share one cached parameters schema; only name/description differ per call.
+    fingerprint = tuple(
+        (
+            param.name,
+            param.kind,
+            param.annotation,
+            _EMPTY if param.default is _EMPTY else repr(param.default),
+        )
         for param in signature.parameters.values()
-        if param.default == inspect.Parameter.empty
-        and param.name != "self"  # Ensure self is not in required
-        and param.kind
-        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
-    ]
+    )
+    try:
+        parameters_properties, required = _parameters_schema(fingerprint)
+    except TypeError:  # unhashable annotation, build without the cache
+        parameters_properties, required = _parameters_schema.__wrapped__(fingerprint)
 
     # Use function's docstring for description, default if none.
     func_description = (
@@ -136,8 +171,11 @@ def function_to_schema(func: Callable[..., Any]) -> FunctionSchema:
             "description": concise_description,  # Using concise description
             "parameters": {
                 "type": "object",
-                "properties": parameters_properties,
-                "required": sorted(required),  # Sort for consistent schema output
+                # Copy the cached template so callers may mutate their schema
+                "properties": {
+                    name: dict(prop) for name, prop in parameters_properties.items()
+                },
+                "required": list(required),
             },
         },
     }
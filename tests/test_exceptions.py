@@ -0,0 +1,10 @@
+import pickle
+
+from isek.exceptions import NodeUnavailableError
+
+
+def test_node_unavailable_error_survives_pickling():
+    error = pickle.loads(pickle.dumps(NodeUnavailableError("n", "down")))
+
+    assert error.node_name == "n"
+    assert str(error) == "Node 'n' is unavailable: down"
@@ -0,0 +1,189 @@
+from collections import deque
+from types import SimpleNamespace
+
+import pytest
+
+from isek import isek_center
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Fresh registry state per test; routes read these module globals by name
+    monkeypatch.setattr(isek_center, "nodes", {})
+    monkeypatch.setattr(isek_center, "lease_expiry", {})
+    monkeypatch.setattr(isek_center, "expiry_heap", [])
+    monkeypatch.setattr(isek_center, "registry_version", 0)
+    monkeypatch.setattr(
+        isek_center, "change_log", deque(maxlen=isek_center.CHANGE_LOG_SIZE)
+    )
+    monkeypatch.setattr(isek_center, "_snapshot_cache", (-1, 0.0, b""))
+    return isek_center.create_app().test_client()
+
+
+def _node(node_id, port=8080):
+    return {"node_id": node_id, "host": "localhost", "port": port}
+
+
+def test_register_batch_stores_every_node(client):
+    response = client.post(
+        "/isek_center/register_batch",
+        json={"nodes": [_node("a"), _node("b", 8081)]},
+    )
+
+    assert response.status_code == 200
+    assert set(isek_center.nodes) == {"a", "b"}
+    assert isek_center.registry_version == 2
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        {"nodes": [_node("ok"), {"node_id": ["x"], "host": "h", "port": 1}]},
+        {"nodes": [_node("ok"), {"node_id": "y", "host": "h"}]},
+        {"nodes": []},
+        [1, 2],
+    ],
+)
+def test_register_batch_rejects_bad_input_without_writing(client, body):
+    response = client.post("/isek_center/register_batch", json=body)
+
+    assert response.status_code == 400
+    assert isek_center.nodes == {}
+    assert isek_center.registry_version == 0
+
+
+def test_renew_batch_reports_unknown_ids(client):
+    client.post("/isek_center/register_batch", json={"nodes": [_node("a")]})
+    before = isek_center.lease_expiry["a"]
+
+    response = client.post("/isek_center/renew_batch", json={"node_ids": ["a", "z"]})
+
+    assert response.status_code == 200
+    assert response.get_json()["data"] == {"renewed": ["a"], "not_found": ["z"]}
+    assert isek_center.lease_expiry["a"] >= before
+
+
+@pytest.mark.parametrize("body", [{"node_ids": ["a", ["b"]]}, {"node_ids": []}, [1]])
+def test_renew_batch_rejects_bad_input_without_renewing(client, body):
+    client.post("/isek_center/register_batch", json={"nodes": [_node("a")]})
+    before = isek_center.lease_expiry["a"]
+
+    response = client.post("/isek_center/renew_batch", json=body)
+
+    assert response.status_code == 400
+    assert isek_center.lease_expiry["a"] == before
+
+
+def _listing(client, since=None):
+    query = {"since": since} if since else None
+    response = client.get("/isek_center/available_nodes", query_string=query)
+    assert response.status_code == 200
+    return response.get_json()["data"]
+
+
+def test_available_nodes_serves_deltas_since_a_version(client):
+    client.post("/isek_center/register", json=_node("a"))
+    full = _listing(client)
+    assert set(full["available_nodes"]) == {"a"}
+
+    client.post("/isek_center/register", json=_node("b", 8081))
+    delta = _listing(client, since=full["version"])
+    assert set(delta["added"]) == {"b"}
+    assert delta["removed"] == []
+
+    client.post("/isek_center/deregister", json={"node_id": "a"})
+    delta = _listing(client, since=delta["version"])
+    assert delta["added"] == {}
+    assert delta["removed"] == ["a"]
+
+    unchanged = _listing(client, since=delta["version"])
+    assert unchanged == {"version": delta["version"], "added": {}, "removed": []}
+
+
+def test_available_nodes_falls_back_to_full_listing_for_other_epochs(client):
+    client.post("/isek_center/register", json=_node("a"))
+
+    data = _listing(client, since="00000000-1")
+
+    assert set(data["available_nodes"]) == {"a"}
+
+
+def test_available_nodes_falls_back_when_tag_is_older_than_change_log(
+    client, monkeypatch
+):
+    monkeypatch.setattr(isek_center, "change_log", deque(maxlen=2))
+    old_tag = _listing(client)["version"]
+    for i in range(4):
+        client.post("/isek_center/register", json=_node(f"n{i}", 8080 + i))
+
+    data = _listing(client, since=old_tag)
+
+    assert set(data["available_nodes"]) == {"n0", "n1", "n2", "n3"}
+
+
+def test_eviction_skips_renewed_leases_and_removes_expired_ones(client, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(
+        isek_center, "time", SimpleNamespace(monotonic=lambda: clock[0])
+    )
+    lease = isek_center.LEASE_DURATION
+    client.post("/isek_center/register", json=_node("renewed"))
+    client.post("/isek_center/register", json=_node("expired", 8081))
+
+    clock[0] += lease / 2
+    response = client.post("/isek_center/renew", json={"node_id": "renewed"})
+    assert response.status_code == 200
+    # The first lease of "renewed" is still queued, now superseded
+    assert len(isek_center.expiry_heap) == 3
+    version = isek_center.registry_version
+
+    with isek_center.NODE_LOCK:
+        isek_center.evict_expired_nodes(1000.0 + lease + 1)
+
+    assert set(isek_center.nodes) == {"renewed"}
+    assert set(isek_center.lease_expiry) == {"renewed"}
+    assert isek_center.expiry_heap == [(1000.0 + lease * 1.5, "renewed")]
+    assert isek_center.registry_version == version + 1
+    assert isek_center.change_log[-1] == (version + 1, "expired", None)
+
+
+class _FlaskResponse:
+    """Just enough of requests.Response for IsekCenterRegistry."""
+
+    def __init__(self, response):
+        self._response = response
+        self.url = response.request.url
+        self.text = response.get_data(as_text=True)
+
+    def raise_for_status(self):
+        assert self._response.status_code == 200
+
+    def json(self):
+        return self._response.get_json()
+
+
+def test_registry_client_applies_deltas_to_its_cache(client, monkeypatch):
+    from isek.node import isek_center_registry
+
+    seen_params = []
+
+    def fake_get(url, params=None, timeout=None):
+        seen_params.append(params)
+        path = url.split("8088", 1)[1]
+        return _FlaskResponse(client.get(path, query_string=params))
+
+    monkeypatch.setattr(isek_center_registry.requests, "get", fake_get)
+    registry = isek_center_registry.IsekCenterRegistry()
+
+    client.post("/isek_center/register", json=_node("a"))
+    assert set(registry.get_available_nodes()) == {"a"}
+    first_version = registry._nodes_version
+
+    client.post("/isek_center/register", json=_node("b", 8081))
+    client.post("/isek_center/deregister", json={"node_id": "a"})
+    nodes = registry.get_available_nodes()
+
+    assert set(nodes) == {"b"}
+    assert nodes["b"]["port"] == 8081
+    assert seen_params == [None, {"since": first_version}]
+    assert registry._nodes_version == _listing(client)["version"]
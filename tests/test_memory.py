@@ -1,3 +1,4 @@
+import json
 import pytest
 from datetime import datetime
 from isek.memory.memory import Memory, UserMemory, SessionSummary
@@ -193,3 +194,54 @@ def test_multiple_users(memory, sample_user_memory):
     assert len(user2_memories) == 1
     assert user1_memories[0].memory == "This is a test memory"
     assert user2_memories[0].memory == "User 2 memory"
+
+
+def test_memory_defaults_are_filled_in():
+    """Test that new memories and summaries get an ID and timestamp"""
+    user_memory = UserMemory(memory="Defaults")
+    summary = SessionSummary(summary="Defaults")
+
+    assert user_memory.memory_id is not None
+    assert isinstance(user_memory.last_updated, datetime)
+    assert isinstance(summary.last_updated, datetime)
+    assert "topics" not in user_memory.to_dict()
+
+
+def test_get_recent_user_memories(memory):
+    """Test limiting user memories to the most recent ones"""
+    for i in range(5):
+        memory.add_user_memory(UserMemory(memory=f"m{i}"), user_id="test_user")
+
+    recent = memory.get_user_memories(user_id="test_user", limit=2)
+    assert [m.memory for m in recent] == ["m3", "m4"]
+    assert memory.get_user_memories(user_id="missing", limit=2) == []
+    assert memory.get_user_memories(user_id="test_user", limit=-1) == []
+
+
+def test_runs_are_capped_per_session():
+    """Test that only the most recent runs of a session are kept"""
+    memory = Memory(run_history_limit=3)
+    for i in range(5):
+        memory.add_run("test_session", {"step": i})
+
+    assert [run["step"] for run in memory.get_runs("test_session")] == [2, 3, 4]
+
+
+def test_to_json_bytes_matches_to_dict(memory, sample_user_memory):
+    """Test that the orjson serializer mirrors to_dict"""
+    memory.add_user_memory(sample_user_memory, user_id="test_user")
+    memory.add_run("test_session", {"action": "test_action"})
+
+    encoded = json.loads(memory.to_json_bytes())
+    expected = json.loads(json.dumps(memory.to_dict(), default=datetime.isoformat))
+
+    assert encoded == expected
+
+
+def test_to_json_bytes_stringifies_runs_in_any_container(memory):
+    """Test that runs assigned as a plain list serialize like to_dict"""
+    memory.runs["test_session"] = [object(), {"step": 1}]
+
+    encoded = json.loads(memory.to_json_bytes())
+
+    assert encoded["runs"] == memory.to_dict()["runs"]
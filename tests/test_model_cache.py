@@ -0,0 +1,75 @@
+from isek.models.base import SimpleMessage
+from isek.models.cache import ResponseCache
+from isek.models.simpleModel import SimpleModel
+
+
+class CountingModel(SimpleModel):
+    """SimpleModel that records how often the provider is actually called."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        return super().invoke(messages, **kwargs)
+
+
+def test_identical_requests_hit_cache():
+    model = CountingModel()
+    model.cache = ResponseCache()
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    first = model.response(messages)
+    second = model.response(messages)
+
+    assert first.content == second.content == "Echo: hi"
+    assert model.calls == 1
+    assert model.cache.hits == 1
+
+
+def test_mutating_the_first_response_does_not_corrupt_hits():
+    model = CountingModel()
+    model.cache = ResponseCache()
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    first = model.response(messages)
+    first.content = "edited by caller"
+
+    assert model.response(messages).content == "Echo: hi"
+    assert model.calls == 1
+
+
+def test_nondeterministic_and_distinct_requests_bypass_cache():
+    model = CountingModel()
+    model.cache = ResponseCache()
+
+    model.response([SimpleMessage(role="user", content="a")], temperature=0.7)
+    model.response([SimpleMessage(role="user", content="a")], temperature=0.7)
+    model.response([SimpleMessage(role="user", content="b")])
+
+    assert model.calls == 3
+    assert len(model.cache) == 1
+
+
+def test_cache_evicts_least_recently_used():
+    cache = ResponseCache(maxsize=1)
+    model = CountingModel()
+    model.cache = cache
+
+    model.response([SimpleMessage(role="user", content="a")])
+    model.response([SimpleMessage(role="user", content="b")])
+    model.response([SimpleMessage(role="user", content="a")])
+
+    assert model.calls == 3
+
+
+def test_stats_report_hits_misses_and_size():
+    model = CountingModel()
+    model.cache = ResponseCache()
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    model.response(messages)
+    model.response(messages)
+
+    assert model.cache.stats() == {"hits": 1, "misses": 1, "size": 1}
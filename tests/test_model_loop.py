@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from isek.models import base
+
+
+def test_concurrent_first_callers_share_one_background_loop(monkeypatch):
+    monkeypatch.setattr(base, "_loop", None)
+    barrier = threading.Barrier(8)
+    loops = []
+
+    def first_call():
+        barrier.wait()
+        loops.append(base._background_loop())
+
+    threads = [threading.Thread(target=first_call) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(loops) == 8
+    assert len({id(loop) for loop in loops}) == 1
+
+
+def test_run_sync_runs_on_the_background_loop():
+    async def current_loop():
+        return asyncio.get_running_loop()
+
+    assert base.run_sync(current_loop()) is base._background_loop()
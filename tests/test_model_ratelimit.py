@@ -0,0 +1,43 @@
+from isek.models import ratelimit
+from isek.models.base import SimpleMessage
+from isek.models.ratelimit import RateLimiter, set_rate_limit
+from isek.models.simpleModel import SimpleModel
+
+
+def test_limiter_delays_once_burst_is_spent():
+    limiter = RateLimiter(rpm=60)  # one request per second, burst of six
+
+    delays = [limiter.reserve() for _ in range(8)]
+
+    assert delays[:6] == [0.0] * 6
+    assert 0.9 < delays[6] < 1.1
+    assert 1.9 < delays[7] < 2.1
+
+
+def test_request_larger_than_bucket_is_charged_in_full():
+    limiter = RateLimiter(tpm=6000)  # 100 tokens per second, bucket of 600
+
+    assert limiter.reserve(3000) == 0.0
+    # The next caller waits off the 2400-token excess plus its own 600
+    assert 29.9 < limiter.reserve(3000) < 30.1
+
+
+def test_models_share_limiter_per_provider_and_model(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {})
+    limiter = set_rate_limit("unknown", "simple-model", rpm=600)
+
+    for _ in range(2):
+        SimpleModel().response([SimpleMessage(role="user", content="hi")])
+
+    assert ratelimit.get_rate_limiter("unknown", "simple-model") is limiter
+    # Two requests taken from the shared burst of 60
+    assert 57.9 < limiter._requests.level < 58.5
+
+
+def test_streams_are_rate_limited(monkeypatch):
+    monkeypatch.setattr(ratelimit, "_LIMITERS", {})
+    limiter = set_rate_limit("unknown", "simple-model", rpm=600)
+
+    list(SimpleModel().stream_text([SimpleMessage(role="user", content="hi")]))
+
+    assert 58.9 < limiter._requests.level < 59.5
@@ -0,0 +1,112 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+from isek.models import base
+from isek.models.base import SimpleMessage
+from isek.models.openai import OpenAIModel
+from isek.models.retry import retry_after, retrying
+from isek.models.simpleModel import SimpleModel
+
+
+def _rate_limit_error(headers):
+    response = httpx.Response(
+        429, headers=headers, request=httpx.Request("POST", "http://test")
+    )
+    return openai.RateLimitError("rate limited", response=response, body=None)
+
+
+def test_retry_after_headers_are_parsed():
+    assert retry_after(_rate_limit_error({"retry-after-ms": "250"})) == 0.25
+    assert retry_after(_rate_limit_error({"retry-after": "3"})) == 3.0
+    assert retry_after(_rate_limit_error({"retry-after": "soon"})) is None
+    assert retry_after(_rate_limit_error({})) is None
+    assert retry_after(ValueError("not a provider error")) is None
+
+
+def test_retry_waits_as_long_as_provider_asks():
+    slept = []
+    controller = retrying(max_retries=1, deadline=60)
+    controller.sleep = slept.append
+
+    calls = 0
+    for attempt in controller:
+        with attempt:
+            calls += 1
+            if calls == 1:
+                raise _rate_limit_error({"retry-after-ms": "10"})
+
+    assert calls == 2
+    assert slept == [0.01]
+
+
+class FailingModel(SimpleModel):
+    """Model whose provider always rejects the request."""
+
+    def invoke(self, messages, **kwargs):
+        raise ValueError("bad request")
+
+    async def ainvoke(self, messages, **kwargs):
+        raise ValueError("bad request")
+
+
+def test_final_failure_is_logged_once_with_traceback(monkeypatch):
+    logged = []
+    monkeypatch.setattr(
+        base.log, "error", lambda *args, **kwargs: logged.append(kwargs)
+    )
+    model = FailingModel()
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    with pytest.raises(ValueError):
+        model.response(messages)
+    with pytest.raises(ValueError):
+        asyncio.run(model.aresponse(messages))
+
+    assert logged == [{"exc_info": True}, {"exc_info": True}]
+
+
+def test_openai_stream_retries_opening_the_stream():
+    calls = []
+
+    def create(**params):
+        calls.append(params)
+        if len(calls) == 1:
+            raise _rate_limit_error({"retry-after-ms": "0"})
+        delta = SimpleNamespace(content="hi")
+        return iter([SimpleNamespace(choices=[SimpleNamespace(delta=delta)])])
+
+    model = OpenAIModel(model_id="gpt-4o-mini", api_key="test")
+    model.client = SimpleNamespace(
+        chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+    )
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    assert list(model.stream_text(messages)) == ["hi"]
+    assert len(calls) == 2
+    assert calls[0]["stream"] is True
+
+
+class FlakyModel(SimpleModel):
+    """Model whose provider rate limits the first request."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def invoke(self, messages, **kwargs):
+        self.calls += 1
+        if self.calls == 1:
+            raise _rate_limit_error({"retry-after-ms": "0"})
+        return super().invoke(messages, **kwargs)
+
+
+def test_default_stream_retries_like_response():
+    model = FlakyModel()
+    messages = [SimpleMessage(role="user", content="hi")]
+
+    assert list(model.stream_text(messages)) == ["Echo: hi"]
+    assert model.calls == 2
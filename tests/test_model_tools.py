@@ -0,0 +1,144 @@
+import threading
+import time
+
+from isek.models.base import SimpleMessage, SimpleModelResponse
+from isek.models.simpleModel import SimpleModel
+from isek.tools.toolkit import Toolkit
+
+
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    return a + b
+
+
+def _tool_call(call_id, a, b, name="add"):
+    return {
+        "id": call_id,
+        "type": "function",
+        "function": {"name": name, "arguments": f'{{"a": {a}, "b": {b}}}'},
+    }
+
+
+class ScriptedModel(SimpleModel):
+    """Asks for the given tool calls once, then answers; records what it was sent."""
+
+    def __init__(self, tool_calls=None):
+        super().__init__()
+        self.tool_calls = tool_calls or [
+            _tool_call("c1", 1, 2),
+            _tool_call("c2", 3, 4),
+        ]
+        self.sent = []
+
+    def invoke(self, messages, **kwargs):
+        self.sent.append(list(messages))
+        if len(self.sent) == 1:
+            return SimpleModelResponse(role="assistant", tool_calls=self.tool_calls)
+        return SimpleModelResponse(role="assistant", content="done")
+
+    def parse_provider_response(self, response, **kwargs):
+        return response
+
+
+def test_tool_results_follow_the_assistant_turn():
+    model = ScriptedModel()
+    toolkit = Toolkit(tools=[add])
+
+    response = model.response(
+        [SimpleMessage(role="user", content="add")],
+        tools=toolkit.tool_schemas(),
+        toolkits=[toolkit],
+    )
+
+    assert response.content == "done"
+    second_request = model.sent[1]
+    assert [m.role for m in second_request] == ["user", "assistant", "tool", "tool"]
+    assert [(m.tool_call_id, m.content) for m in second_request[2:]] == [
+        ("c1", "3"),
+        ("c2", "7"),
+    ]
+
+
+def test_tool_calls_of_one_turn_run_concurrently():
+    # Each call only returns once both are running at the same time
+    barrier = threading.Barrier(2, timeout=5)
+
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        barrier.wait()
+        return a + b
+
+    model = ScriptedModel()
+    toolkit = Toolkit(tools=[add])
+
+    model.response(
+        [SimpleMessage(role="user", content="add")],
+        tools=toolkit.tool_schemas(),
+        toolkits=[toolkit],
+    )
+
+    assert [m.content for m in model.sent[1][2:]] == ["3", "7"]
+
+
+def _run_with_timeout(target, timeout=10):
+    thread = threading.Thread(target=target, daemon=True)
+    thread.start()
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def test_nested_agent_tool_calls_do_not_deadlock():
+    def sub_agent(a: int, b: int) -> str:
+        """Run an inner agent turn that itself makes two tool calls."""
+        inner = ScriptedModel()
+        toolkit = Toolkit(tools=[add])
+        return inner.response(
+            [SimpleMessage(role="user", content="inner")],
+            tools=toolkit.tool_schemas(),
+            toolkits=[toolkit],
+        ).content
+
+    outer = ScriptedModel(
+        [_tool_call(f"c{i}", i, i, name="sub_agent") for i in range(16)]
+    )
+    outer.max_tool_workers = 2
+    toolkit = Toolkit(tools=[sub_agent])
+
+    def run():
+        outer.response(
+            [SimpleMessage(role="user", content="outer")],
+            tools=toolkit.tool_schemas(),
+            toolkits=[toolkit],
+        )
+
+    assert _run_with_timeout(run)
+    assert [m.content for m in outer.sent[1][2:]] == ["done"] * 16
+
+
+def test_tool_calls_run_serially_when_opted_out():
+    running = []
+    overlaps = []
+
+    def add(a: int, b: int) -> int:
+        """Add two numbers."""
+        running.append(1)
+        overlaps.append(len(running))
+        time.sleep(0.01)
+        running.pop()
+        return a + b
+
+    unsafe = Toolkit(tools=[add], thread_safe=False)
+    ScriptedModel().response(
+        [SimpleMessage(role="user", content="add")],
+        tools=unsafe.tool_schemas(),
+        toolkits=[unsafe],
+    )
+    safe = Toolkit(tools=[add])
+    ScriptedModel().response(
+        [SimpleMessage(role="user", content="add")],
+        tools=safe.tool_schemas(),
+        toolkits=[safe],
+        parallel_tools=False,
+    )
+
+    assert overlaps == [1, 1, 1, 1]
@@ -0,0 +1,118 @@
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from isek.models.openai import OpenAIModel
+
+
+def _completion(content):
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-4o-mini",
+        "choices": [
+            {
+                "index": 0,
+                "message": {"role": "assistant", "content": content},
+                "finish_reason": "stop",
+            }
+        ],
+    }
+
+
+class FakeBatchClient:
+    """Stands in for the ``files``/``batches`` parts of the OpenAI client."""
+
+    def __init__(self, batch=None, output=""):
+        self.uploads = []
+        self.created = []
+        self.batch = batch
+        self.output = output
+        self.files = SimpleNamespace(create=self._upload, content=self._content)
+        self.batches = SimpleNamespace(create=self._create, retrieve=self._retrieve)
+
+    def _upload(self, file, purpose):
+        self.uploads.append((file, purpose))
+        return SimpleNamespace(id="file-in")
+
+    def _create(self, **params):
+        self.created.append(params)
+        return SimpleNamespace(id="batch-1")
+
+    def _retrieve(self, batch_id):
+        return self.batch
+
+    def _content(self, file_id):
+        return SimpleNamespace(text=self.output)
+
+
+def _model(client):
+    model = OpenAIModel(model_id="gpt-4o-mini", api_key="test")
+    model.client = client
+    return model
+
+
+def test_submit_batch_uploads_one_request_per_prompt():
+    client = FakeBatchClient()
+    model = _model(client)
+
+    assert model.submit_batch(["one", "two"], temperature=0) == "batch-1"
+
+    (name, content), purpose = client.uploads[0]
+    assert (name, purpose) == ("batch.jsonl", "batch")
+    lines = [json.loads(line) for line in content.decode().splitlines()]
+    assert [line["custom_id"] for line in lines] == ["request-0", "request-1"]
+    assert all(line["method"] == "POST" for line in lines)
+    assert all(line["url"] == "/v1/chat/completions" for line in lines)
+    assert lines[1]["body"] == {
+        "model": "gpt-4o-mini",
+        "messages": [{"role": "user", "content": "two"}],
+        "temperature": 0,
+    }
+    assert client.created == [
+        {
+            "input_file_id": "file-in",
+            "endpoint": "/v1/chat/completions",
+            "completion_window": "24h",
+        }
+    ]
+
+
+def test_retrieve_batch_orders_results_and_maps_failures_to_none():
+    rows = [
+        {
+            "custom_id": "request-2",
+            "response": {"status_code": 200, "body": _completion("third")},
+        },
+        {"custom_id": "request-1", "response": {"status_code": 500, "body": {}}},
+        {
+            "custom_id": "request-0",
+            "response": {"status_code": 200, "body": _completion("first")},
+        },
+    ]
+    batch = SimpleNamespace(
+        status="completed",
+        output_file_id="file-out",
+        request_counts=SimpleNamespace(total=4),
+    )
+    client = FakeBatchClient(batch, "\n".join(json.dumps(row) for row in rows))
+
+    results = _model(client).retrieve_batch("batch-1")
+
+    # Length comes from request_counts, so the missing last row is None too
+    assert len(results) == 4
+    assert results[0].content == "first"
+    assert results[1] is None
+    assert results[2].content == "third"
+    assert results[3] is None
+
+
+def test_retrieve_batch_pending_and_failed():
+    batch = SimpleNamespace(status="in_progress")
+    assert _model(FakeBatchClient(batch)).retrieve_batch("batch-1") is None
+
+    batch = SimpleNamespace(status="expired")
+    with pytest.raises(RuntimeError, match="expired"):
+        _model(FakeBatchClient(batch)).retrieve_batch("batch-1")
@@ -273,3 +273,43 @@ def test_multiple_toolkits():
     # Test execution
     assert toolkit1.execute_function("func1") == "toolkit1"
     assert toolkit2.execute_function("func2") == "toolkit2"
+
+
+def test_optional_parameter_schema_types(toolkit):
+    """Test that Optional[T] and PEP 604 `T | None` map to the inner type"""
+
+    def lookup(count: Optional[int] = None, ratio: float | None = None) -> str:
+        """Look something up."""
+        return f"{count}: {ratio}"
+
+    toolkit.register(lookup)
+
+    properties = toolkit.get_function("lookup").parameters["properties"]
+    assert properties["count"]["type"] == "integer"
+    assert properties["ratio"]["type"] == "number"
+    assert toolkit.get_function("lookup").parameters["required"] == []
+
+
+def test_reregister_same_function_is_noop(toolkit):
+    """Test that registering the same callable twice keeps the first entry"""
+
+    def ping() -> str:
+        """Ping."""
+        return "pong"
+
+    first = toolkit.register(ping)
+    second = toolkit.register(ping)
+
+    assert second is first
+    assert len(toolkit.functions) == 1
+
+
+def test_tool_schemas_refresh_on_register(toolkit, sample_functions):
+    """Test that cached tool schemas pick up newly registered functions"""
+    toolkit.register(sample_functions[0])
+    first = toolkit.tool_schemas()
+    assert toolkit.tool_schemas()[0] is first[0]
+
+    toolkit.register(sample_functions[1])
+    names = [schema["function"]["name"] for schema in toolkit.tool_schemas()]
+    assert names == [sample_functions[0].__name__, sample_functions[1].__name__]